@@ -1,6 +1,7 @@
 """Abstract interface for build systems."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple, Optional, Dict, Any, List
 import logging
@@ -66,6 +67,35 @@ class BuildSystem(ABC):
         """
         pass
     
+    def run_specific_tests(
+        self,
+        test_class: str,
+        test_methods: List[str],
+        test_file_path: Optional[Path] = None,
+        max_workers: int = 1
+    ) -> Dict[str, Tuple[bool, str]]:
+        """Run several methods of the same test class.
+        
+        The default implementation runs each method with run_specific_test,
+        up to max_workers at a time. Build systems that can select several
+        methods in a single invocation should override this.
+        
+        Args:
+            test_class: Fully qualified test class name
+            test_methods: Test method names
+            test_file_path: Optional path to the test file for module detection
+            max_workers: Maximum number of methods to run concurrently
+            
+        Returns:
+            Dictionary mapping each method name to (success, output_message)
+        """
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(test_methods)))) as pool:
+            outcomes = pool.map(
+                lambda method: self.run_specific_test(test_class, method, test_file_path),
+                test_methods
+            )
+            return dict(zip(test_methods, outcomes))
+    
     @abstractmethod
     def find_module_root(self, test_file_path: Path) -> Optional[Path]:
         """Find the module root directory containing the test file.
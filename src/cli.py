@@ -8,23 +8,53 @@ the refactored code remains functional.
 """
 
 import argparse
+import os
+import subprocess
 import sys
 from pathlib import Path
-from typing import List, Tuple, Optional
-import pandas as pd
+from typing import Dict, Iterator, List, Tuple, Optional, TYPE_CHECKING
 import logging
 import csv
 import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 from .discovery import TestDiscovery, TestCase
-from .refactor import TestRefactor, RefactoringResult, TestContext
 from .validator import CodeValidator
-from .executor import ResultsRecorder
-from .logger import setup_logger
+from .logger import setup_logger, log_prefix
 from .utils import BackupManager, check_and_auto_update
 
+# pandas, the LLM client and the results recorder are imported by the phases that need them,
+# so --help, --version and --clean-refactored-only start without loading them
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger('aif')
 
+# Prompt templates shipped next to the src package
+_PROMPTS_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+# Strategies share the wide results CSV and the usage CSV; serialize their read-modify-write
+_refactoring_output_lock = threading.Lock()
+
+# Regex to find method declarations in Java
+# Matches: @Test or public/private/protected + return_type + method_name + (
+_JAVA_METHOD_RE = re.compile(
+    r'(?:@Test\s+)?(?:public|private|protected)\s+(?:static\s+)?(?:[\w<>\[\]]+\s+)*(\w+)\s*\(',
+    re.MULTILINE
+)
+
+# Test smells whose refactoring typically splits one test into several methods
+_ONE_TO_MANY_TESTSMELL_ISSUES = frozenset({'eager test', 'multiple acts', 'conditional test logic'})
+
+# First path component naming a known module, for grouping compilation failures
+_MODULE_PART_RE = re.compile(r'(?:^|[\\/])(core|plugins|[^\\/]*(?:struts|tiles|samza)[^\\/]*)(?=[\\/]|$)')
+
+# Everything from the start of a Java file up to the end of its last import line
+_IMPORT_SECTION_RE = re.compile(r'\A.*^[ \t]*import [^\n]*', re.MULTILINE | re.DOTALL)
+
 def validate_paths(java_project_path: str, data_folder_path: str, output_folder_path: str) -> Tuple[Path, Path, Path]:
     """Validate and return Path objects for input arguments."""
     java_path = Path(java_project_path).resolve()
@@ -89,44 +119,58 @@ def discovery_phase(java_project_path: Path, data_folder_path: Path, output_path
     return output_file
 
 
-def load_test_cases_from_csv(input_file: Path) -> List[TestCase]:
-    """Load test cases from a specified CSV file."""
+def iter_test_cases_from_csv(input_file: Path) -> Iterator[TestCase]:
+    """Stream test cases from a specified CSV file, one row at a time."""
     if not input_file.exists():
         raise FileNotFoundError(f"Input file not found: {input_file}")
 
-    df = pd.read_csv(input_file)
-    df.fillna('', inplace=True)
-    test_cases = []
-    for _, row in df.iterrows():
-        # Handle different column name formats
-        project_name = row.get('project_name', row.get('project', ''))
-        test_class_name = row.get('test_class_name', row.get('class_name', ''))
-        test_method_name = row.get('test_method_name', row.get('test_case_name', ''))
-        issue_type = row.get('issue_type', '')
-        
-        test_case = TestCase(
-            project_name=project_name,
-            test_class_name=test_class_name,
-            test_method_name=test_method_name,
-            issue_type=issue_type
-        )
-        
-        # Handle test_path - try to get from CSV or auto-discover
-        test_path = row.get('test_path', 'not found')
-        if test_path == 'not found' or not test_path:
-            # Auto-discover test file path based on class name
-            discovered_path = _discover_test_file_path(test_class_name, input_file.parent.parent)
-            test_case.test_path = discovered_path if discovered_path else 'not found'
-            if discovered_path:
-                logger.info(f"Auto-discovered test path: {test_class_name} -> {discovered_path}")
-        else:
-            test_case.test_path = test_path
+    with open(input_file, 'r', encoding='utf-8-sig', newline='') as f:
+        for row in csv.DictReader(f):
+            # Handle different column name formats; short rows give None for missing fields
+            project_name = row.get('project_name', row.get('project', '')) or ''
+            test_class_name = row.get('test_class_name', row.get('class_name', '')) or ''
+            test_method_name = row.get('test_method_name', row.get('test_case_name', '')) or ''
+            issue_type = row.get('issue_type', '') or ''
             
-        test_case.test_case_loc = row.get('test_case_LOC', 0)
-        test_case.runable = row.get('runable', 'no')
-        test_case.pass_status = row.get('pass', 'no')
-        test_cases.append(test_case)
-    return test_cases
+            test_case = TestCase(
+                project_name=project_name,
+                test_class_name=test_class_name,
+                test_method_name=test_method_name,
+                issue_type=issue_type
+            )
+            
+            # Handle test_path - try to get from CSV or auto-discover
+            test_path = row.get('test_path', 'not found') or ''
+            if test_path == 'not found' or not test_path:
+                # Auto-discover test file path based on class name
+                discovered_path = _discover_test_file_path(test_class_name, input_file.parent.parent)
+                test_case.test_path = discovered_path if discovered_path else 'not found'
+                if discovered_path:
+                    logger.info(f"Auto-discovered test path: {test_class_name} -> {discovered_path}")
+            else:
+                test_case.test_path = test_path
+                
+            # CSVs written back by pandas may store LOC as "12.0"
+            loc = (row.get('test_case_LOC') or '').strip()
+            try:
+                test_case.test_case_loc = int(float(loc)) if loc else 0
+            except (ValueError, OverflowError):
+                test_case.test_case_loc = 0
+            test_case.runable = row.get('runable', 'no') or ''
+            test_case.pass_status = row.get('pass', 'no') or ''
+            yield test_case
+
+
+def load_test_cases_from_csv(input_file: Path) -> List[TestCase]:
+    """Load test cases from a specified CSV file."""
+    # The refactoring phase needs len() and makes several passes, so materialize once
+    return list(iter_test_cases_from_csv(input_file))
+
+
+# Test source directory that last resolved a class, per search base; probed first on later lookups.
+# Shared by concurrent strategy threads, so access goes through the lock.
+_project_testdir_cache: Dict[Path, Path] = {}
+_project_testdir_lock = threading.Lock()
 
 
 def _discover_test_file_path(test_class_name: str, search_base: Path) -> Optional[str]:
@@ -137,6 +181,14 @@ def _discover_test_file_path(test_class_name: str, search_base: Path) -> Optiona
     # Convert package.ClassName to path format
     class_path = test_class_name.replace('.', '/') + '.java'
     
+    # Most classes of a project live under the same test directory, so try it first
+    with _project_testdir_lock:
+        cached_dir = _project_testdir_cache.get(search_base)
+    if cached_dir is not None:
+        potential_path = os.path.join(cached_dir, class_path)
+        if os.path.exists(potential_path):
+            return potential_path
+    
     # Common test directory patterns
     test_dirs = [
         'src/test/java',
@@ -150,13 +202,24 @@ def _discover_test_file_path(test_class_name: str, search_base: Path) -> Optiona
     
     for base_path in search_paths:
         for test_dir in test_dirs:
-            potential_path = base_path / test_dir / class_path
-            if potential_path.exists():
-                return str(potential_path)
+            candidate_dir = os.path.join(base_path, test_dir)
+            potential_path = os.path.join(candidate_dir, class_path)
+            if os.path.exists(potential_path):
+                with _project_testdir_lock:
+                    _project_testdir_cache[search_base] = Path(candidate_dir)
+                return potential_path
     
     return None
 
 
+def _tagged_refactoring_phase(test_cases: List[TestCase], java_project_path: Path,
+                              data_folder_path: Path, output_path: Path, rftype: str,
+                              debug_mode: bool = False) -> None:
+    """Run refactoring_phase with its log lines tagged by strategy, for concurrent runs."""
+    with log_prefix(rftype.upper()):
+        refactoring_phase(test_cases, java_project_path, data_folder_path, output_path, rftype, debug_mode)
+
+
 def refactoring_phase(test_cases: List[TestCase], java_project_path: Path,
                      data_folder_path: Path, output_path: Path, rftype: str,
                       debug_mode: bool = False) -> None:
@@ -164,8 +227,10 @@ def refactoring_phase(test_cases: List[TestCase], java_project_path: Path,
     logger.info(f"\nPhase 2: Test Refactoring ({rftype.upper()} strategy)")
     logger.info("=" * 50)
 
-    prompts_dir = Path(__file__).resolve().parent.parent / "prompts"
-    refactor = TestRefactor(prompts_dir, data_folder_path, rftype, output_path, java_project_path)
+    from .refactor import TestRefactor, RefactoringResult
+    from .executor import ResultsRecorder
+
+    refactor = TestRefactor(_PROMPTS_DIR, data_folder_path, rftype, output_path, java_project_path)
     recorder = ResultsRecorder(output_path)
 
     # Process ALL test cases regardless of their runnable/pass status from Phase 1
@@ -239,12 +304,14 @@ def refactoring_phase(test_cases: List[TestCase], java_project_path: Path,
                 results.append(result_record)
 
     if results:
-        output_file = recorder.save_results(project_name, rftype, results)
+        with _refactoring_output_lock:
+            output_file = recorder.save_results(project_name, rftype, results)
         logger.info(f"\n✓ Refactoring results for '{rftype}' strategy saved to {output_file}")
         
         # Save usage statistics
         if refactor.usage_tracker:
-            usage_file = refactor.usage_tracker.save_usage_statistics(project_name)
+            with _refactoring_output_lock:
+                usage_file = refactor.usage_tracker.save_usage_statistics(project_name)
             if usage_file:
                 logger.info(f"✓ Usage statistics saved to {usage_file}")
                 # Log summary
@@ -256,8 +323,13 @@ def refactoring_phase(test_cases: List[TestCase], java_project_path: Path,
 
 def execution_test_phase(java_project_path: Path, output_path: Path, 
                          debug_mode: bool = False, keep_files: bool = False,
-                         fallback_manual: bool = True, skip_initial_build: bool = False) -> None:
-    """Phase 3: Execution Testing. Integrates and tests all refactored code."""
+                         fallback_manual: bool = True, skip_initial_build: bool = False,
+                         parallel: int = 1) -> None:
+    """Phase 3: Execution Testing. Integrates and tests all refactored code.
+
+    Build systems without batched test selection run up to `parallel` refactored
+    methods of the same test case concurrently.
+    """
     logger.info("\nPhase 3: Execution Testing")
     logger.info("=" * 50)
     
@@ -286,21 +358,34 @@ def execution_test_phase(java_project_path: Path, output_path: Path,
         logger.warning(f"No exact match found for project '{java_project_name}', using: {results_file}")
         logger.info(f"Available result files: {[f.name for f in result_files]}")
 
-    df = pd.read_csv(results_file)
-    df.fillna('', inplace=True)
+    import pandas as pd
+    from .executor import ResultsRecorder
+
+    df = pd.read_csv(results_file, dtype=str, na_filter=False, keep_default_na=False)
     
     validator = CodeValidator(java_project_path)
     recorder = ResultsRecorder(output_path)
     backup_mgr = BackupManager()
 
+    # One SmartImportManager for the whole run; its JUnit/Hamcrest detection does not depend on the file
+    from .import_manager import SmartImportManager
+    import_manager = SmartImportManager(java_project_path)
+
     # Import and create build manager
     from .build_system import SmartBuildManager
     build_manager = SmartBuildManager(validator.build_system)
 
     # Get a unique list of all test files to back them up once
-    all_test_paths = {p for p in df['test_path'].unique() if p and Path(p).exists()}
+    unique_test_paths = [p for p in df['test_path'].unique() if p]
+    all_test_paths = [p for p in unique_test_paths if os.path.exists(p)]
+    if len(all_test_paths) < len(unique_test_paths):
+        logger.debug(f"{len(unique_test_paths) - len(all_test_paths)} test file(s) not found, not backed up")
     backup_mgr.backup([Path(p) for p in all_test_paths])
 
+    # Method names of the original (backed-up) files, parsed once per test file.
+    # Every row restores its file from backup first, so the original content never changes.
+    original_methods_cache = {}
+
     # Initialize execution summary tracking
     execution_summary = {
         'total_strategies': 0,
@@ -312,18 +397,14 @@ def execution_test_phase(java_project_path: Path, output_path: Path,
         'total_tests_run': 0
     }
 
+    # Only strategies whose refactored code is present in the results need testing
+    present_cols = set(df.columns)
+    active_strategies = [columns for columns in recorder.STRATEGY_COLUMNS if columns[2] in present_cols]
+    execution_summary['total_strategies'] = len(recorder.STRATEGY_MAPPING)
+
     try:
-        for strategy in recorder.STRATEGY_MAPPING.keys():
-            prefix = recorder.STRATEGY_MAPPING[strategy]
-            code_col = f'{prefix}_refactored_test_case_code'
-            error_col = f'{prefix}_refactoring_error'
-            result_col = f'{prefix}_refactored_test_case_result'
+        for strategy, _, code_col, error_col, imports_col, method_names_col, result_col in active_strategies:
             
-            execution_summary['total_strategies'] += 1
-            
-            if code_col not in df.columns:
-                continue
-
             logger.info(f"\n--- Testing Strategy: {strategy.upper()} ---")
             
             # Filter for rows that have successful refactorings for this strategy
@@ -333,22 +414,28 @@ def execution_test_phase(java_project_path: Path, output_path: Path,
                 continue
 
             execution_summary['strategies_with_tests'] += 1
+            # Create the result column up front so the scalar df.at writes below never enlarge the frame
+            if result_col not in df.columns:
+                df[result_col] = ''
 
             # Collect all files that will be modified for incremental compilation
             modified_files = []
-            for _, row in strategy_df.iterrows():
-                test_path = Path(row['test_path'])
+            for test_path_str in strategy_df['test_path']:
+                test_path = Path(test_path_str)
                 if test_path.exists():
                     modified_files.append(test_path)
 
             # Check if Hamcrest dependency is needed for this strategy
-            hamcrest_needed = any('hamcrest' in str(row.get(f'{prefix}_refactored_test_case_imports', '')).lower() 
-                                for _, row in strategy_df.iterrows())
+            hamcrest_needed = (imports_col in present_cols and
+                               strategy_df[imports_col].astype(str).str.contains('hamcrest', case=False, regex=False).any())
             
+            # Once Hamcrest is known to be available, rows needing it skip the dependency check
+            hamcrest_ready = False
             if hamcrest_needed:
                 logger.info("Detecting Hamcrest usage, ensuring dependency is available...")
                 hamcrest_success, hamcrest_message = validator.ensure_hamcrest_dependency()
                 if hamcrest_success:
+                    hamcrest_ready = True
                     logger.info(f"✓ Hamcrest dependency ready: {hamcrest_message}")
                 else:
                     logger.warning(f"⚠ Hamcrest dependency issue: {hamcrest_message}")
@@ -373,325 +460,365 @@ def execution_test_phase(java_project_path: Path, output_path: Path,
             
             logger.info(f"✓ Execution environment ready: {exec_message}")
 
-            for _, row in strategy_df.iterrows():
-                test_path = Path(row['test_path'])
-                test_full_name = f"{row['test_class_name']}.{row['test_method_name']}"
-                logger.info(f"Testing {test_full_name}...")
-                execution_summary['total_tests_run'] += 1
+            # Group rows by test file so each file is restored, integrated, written and
+            # compiled once, no matter how many of its methods were refactored. Files are
+            # processed one at a time: files of the same module share build outputs, and
+            # Hamcrest setup edits the shared build files.
+            for test_path_str, group_df in strategy_df.groupby('test_path', sort=False):
+                test_path = Path(test_path_str)
                 
                 # Skip tests with invalid file paths
-                if not test_path.exists() or str(test_path) == "not found":
-                    logger.warning(f"  ✗ Test file not found: {test_path}")
-                    df.loc[df.index == row.name, result_col] = "file_not_found"
-                    execution_summary['test_failures'].append({
-                        'strategy': strategy,
-                        'test': test_full_name,
-                        'reason': 'Test file not found'
-                    })
+                if not test_path_str or not test_path.exists() or str(test_path) == "not found":
+                    for row_index, row in group_df.to_dict('index').items():
+                        test_full_name = f"{row['test_class_name']}.{row['test_method_name']}"
+                        logger.info(f"Testing {test_full_name}...")
+                        execution_summary['total_tests_run'] += 1
+                        logger.warning(f"  ✗ Test file not found: {test_path}")
+                        df.at[row_index, result_col] = "file_not_found"
+                        execution_summary['test_failures'].append({
+                            'strategy': strategy,
+                            'test': test_full_name,
+                            'reason': 'Test file not found'
+                        })
                     continue
                 
-                # We need to re-integrate code for each test, as previous integrations are reverted
-                # This is inefficient but safe. A better way would be to group by file.
-                # For now, we restore, modify, test, and move to the next.
+                logger.info(f"Integrating {len(group_df)} refactored test(s) into {test_path.name}...")
                 backup_mgr.restore_file(test_path)
                 
-                # Extract method names from refactored code to handle mismatches
-                refactored_method_names = _extract_method_names_from_code(row[code_col])
-                csv_method_name = row['test_method_name']
+                # Read file content once for all operations
+                original_content = test_path.read_text(encoding='utf-8')
                 
-                # Determine which method to comment out/delete
-                target_method_for_removal = csv_method_name
-                if refactored_method_names:
-                    # Check if any refactored method conflicts with existing methods
-                    with open(test_path, 'r', encoding='utf-8') as f:
-                        original_content = f.read()
-                    original_method_names = _extract_method_names_from_code(original_content)
+                # Plain dict records avoid boxing a Series per row and per cell lookup
+                integrations = []  # (row_index, row, target_method_for_removal, is_one_to_many, imports)
+                issues_norm = group_df['issue_type'].astype(str).str.strip().str.lower()
+                for row_index, row in group_df.to_dict('index').items():
+                    issue_norm = issues_norm[row_index]
+                    test_full_name = f"{row['test_class_name']}.{row['test_method_name']}"
+                    logger.info(f"Testing {test_full_name}...")
+                    execution_summary['total_tests_run'] += 1
                     
-                    # For testsmell strategy, handle method name conflicts more intelligently
-                    if strategy == 'testsmell':
-                        method_conflicts = []
-                        for ref_method in refactored_method_names:
-                            if ref_method in original_method_names:
-                                method_conflicts.append(ref_method)
-                        
-                        if method_conflicts:
-                            logger.info(f"  ⚠️ Testsmell method name conflicts detected: {', '.join(method_conflicts)}")
-                            logger.info(f"  🔄 Will remove original method '{csv_method_name}' to avoid conflicts")
-                            # For testsmell, always remove the original method when there are conflicts
-                            target_method_for_removal = csv_method_name
-                    else:
-                        # Original logic for AAA/DSL strategies
-                        for ref_method in refactored_method_names:
-                            if ref_method in original_method_names and ref_method != csv_method_name:
-                                # Found a conflict - we should remove the conflicting method instead
-                                target_method_for_removal = ref_method
-                                logger.info(f"  📝 Method name mismatch detected:")
-                                logger.info(f"     CSV method: {csv_method_name}")
-                                logger.info(f"     Refactored method: {ref_method}")
-                                logger.info(f"     Will comment out: {target_method_for_removal}")
-                                break
-                
-                # Integrate the code
-                # Determine if this is one-to-many refactoring based on strategy and method count
-                if strategy == 'testsmell':
-                    # For testsmell strategy, check if we have multiple refactored methods
-                    num_refactored_methods = len(refactored_method_names) if refactored_method_names else 0
-                    is_one_to_many = num_refactored_methods > 1
+                    # Extract method names from refactored code to handle mismatches
+                    refactored_method_names = _extract_method_names_from_code(row[code_col])
+                    csv_method_name = row['test_method_name']
                     
-                    # Special handling for test smells that typically create multiple methods
-                    if row.get('issue_type', '').lower() in ['eager test', 'multiple acts', 'conditional test logic']:
-                        is_one_to_many = True
+                    # Determine which method to comment out/delete
+                    target_method_for_removal = csv_method_name
+                    if refactored_method_names:
+                        # Check if any refactored method conflicts with existing methods
+                        original_method_names = original_methods_cache.get(test_path)
+                        if original_method_names is None:
+                            original_method_names = _extract_method_names_from_code(original_content)
+                            original_methods_cache[test_path] = original_method_names
                         
-                    logger.info(f"  📊 Testsmell strategy: {num_refactored_methods} methods generated, one-to-many: {is_one_to_many}")
-                else:
-                    # For AAA and DSL strategies, use the original logic
-                    is_one_to_many = row['issue_type'].lower().strip() == "multiple aaa"
-                # Parse additional imports, filtering out empty strings
-                imports_str = row[f'{prefix}_refactored_test_case_imports']
-                raw_imports = [imp.strip() for imp in imports_str.split(',') if imp.strip()] if imports_str else []
-                
-                # Use SmartImportManager for all import processing
-                from .import_manager import SmartImportManager
-                import_manager = SmartImportManager(java_project_path)
-                
-                # Read file content once for all operations
-                original_content = test_path.read_text(encoding='utf-8')
-                
-                # Use SmartImportManager to normalize and validate imports
-                additional_imports = []
-                for imp in raw_imports:
-                    normalized = import_manager._normalize_import_format(imp, original_content)
-                    if normalized:  # Only add if normalization succeeded (filters out comments, etc.)
-                        additional_imports.append(normalized)
-                
-                # For DSL strategy, also detect missing imports automatically
-                if strategy == 'dsl':
-                    # Analyze the refactored code for missing imports
-                    existing_imports = set()
-                    # Convert additional_imports to proper format for checking
-                    for imp in additional_imports:
-                        if imp.startswith('static '):
-                            existing_imports.add(f"import {imp};")
+                        # For testsmell strategy, handle method name conflicts more intelligently
+                        if strategy == 'testsmell':
+                            method_conflicts = []
+                            for ref_method in refactored_method_names:
+                                if ref_method in original_method_names:
+                                    method_conflicts.append(ref_method)
+                            
+                            if method_conflicts:
+                                logger.info(f"  ⚠️ Testsmell method name conflicts detected: {', '.join(method_conflicts)}")
+                                logger.info(f"  🔄 Will remove original method '{csv_method_name}' to avoid conflicts")
+                                # For testsmell, always remove the original method when there are conflicts
+                                target_method_for_removal = csv_method_name
                         else:
-                            existing_imports.add(f"import {imp};")
+                            # Original logic for AAA/DSL strategies
+                            for ref_method in refactored_method_names:
+                                if ref_method in original_method_names and ref_method != csv_method_name:
+                                    # Found a conflict - we should remove the conflicting method instead
+                                    target_method_for_removal = ref_method
+                                    logger.info(f"  📝 Method name mismatch detected:")
+                                    logger.info(f"     CSV method: {csv_method_name}")
+                                    logger.info(f"     Refactored method: {ref_method}")
+                                    logger.info(f"     Will comment out: {target_method_for_removal}")
+                                    break
                     
-                    requirements = import_manager.analyze_code_requirements(row[code_col], existing_imports)
-                    
-                    # Add any missing imports detected by the smart manager
-                    for req in requirements:
-                        import_stmt = req.import_statement
-                        # Ensure proper format for additional_imports list
-                        if import_stmt.startswith('import '):
-                            import_stmt = import_stmt[7:]  # Remove 'import '
-                        if import_stmt.endswith(';'):
-                            import_stmt = import_stmt[:-1]  # Remove ';'
+                    # Determine if this is one-to-many refactoring based on strategy and method count
+                    if strategy == 'testsmell':
+                        # For testsmell strategy, check if we have multiple refactored methods
+                        num_refactored_methods = len(refactored_method_names) if refactored_method_names else 0
+                        is_one_to_many = num_refactored_methods > 1
+                        
+                        # Special handling for test smells that typically create multiple methods
+                        if issue_norm in _ONE_TO_MANY_TESTSMELL_ISSUES:
+                            is_one_to_many = True
                             
-                        # Only add if not already present
-                        if import_stmt not in additional_imports:
-                            additional_imports.append(import_stmt)
-                            logger.info(f"  📦 Auto-detected missing import: {import_stmt} ({req.reason})")
-                
-                # CRITICAL: Analyze all imports to determine required dependencies BEFORE integration
-                if additional_imports:
-                    logger.info(f"  🔍 Analyzing {len(additional_imports)} imports for dependency requirements...")
+                        logger.info(f"  📊 Testsmell strategy: {num_refactored_methods} methods generated, one-to-many: {is_one_to_many}")
+                    else:
+                        # For AAA and DSL strategies, use the original logic
+                        is_one_to_many = issue_norm == "multiple aaa"
+                    # Parse additional imports, filtering out empty strings
+                    imports_str = row[imports_col]
+                    raw_imports = [imp.strip() for imp in imports_str.split(',') if imp.strip()] if imports_str else []
                     
-                    # Use SmartImportManager to analyze third-party dependencies
-                    third_party_deps_needed = import_manager.analyze_third_party_dependencies(additional_imports)
+                    # Use SmartImportManager to normalize and validate imports
+                    additional_imports = []
+                    seen_imports = set()
+                    for imp in raw_imports:
+                        normalized = import_manager._normalize_import_format(imp, original_content)
+                        # Only add if normalization succeeded (filters out comments, etc.)
+                        if normalized and normalized not in seen_imports:
+                            additional_imports.append(normalized)
+                            seen_imports.add(normalized)
                     
-                    # Also analyze production imports for potential issues
-                    production_analysis = import_manager.analyze_production_imports(additional_imports, original_content)
-                    if production_analysis['recommendations']:
-                        for recommendation in production_analysis['recommendations']:
-                            logger.warning(f"  ⚠ Production import analysis: {recommendation}")
+                    # For DSL strategy, also detect missing imports automatically
+                    if strategy == 'dsl':
+                        # Analyze the refactored code for missing imports
+                        existing_imports = set()
+                        # Convert additional_imports to proper format for checking
+                        for imp in additional_imports:
+                            if imp.startswith('static '):
+                                existing_imports.add(f"import {imp};")
+                            else:
+                                existing_imports.add(f"import {imp};")
+                        
+                        requirements = import_manager.analyze_code_requirements(row[code_col], existing_imports)
+                        
+                        # Add any missing imports detected by the smart manager
+                        for req in requirements:
+                            import_stmt = req.import_statement
+                            # Ensure proper format for additional_imports list
+                            if import_stmt.startswith('import '):
+                                import_stmt = import_stmt[7:]  # Remove 'import '
+                            if import_stmt.endswith(';'):
+                                import_stmt = import_stmt[:-1]  # Remove ';'
+                                
+                            # Only add if not already present
+                            if import_stmt not in seen_imports:
+                                additional_imports.append(import_stmt)
+                                seen_imports.add(import_stmt)
+                                logger.info(f"  📦 Auto-detected missing import: {import_stmt} ({req.reason})")
                     
-                    # Add required dependencies before proceeding
-                    for dep in third_party_deps_needed:
-                        logger.info(f"  📚 Detected {dep['type'].upper()} usage, ensuring dependency is available...")
-                        logger.debug(f"    Required imports: {', '.join(dep['imports'])}")
+                    # CRITICAL: Analyze all imports to determine required dependencies BEFORE integration
+                    dependency_failed = False
+                    if additional_imports:
+                        logger.info(f"  🔍 Analyzing {len(additional_imports)} imports for dependency requirements...")
+                        
+                        # Use SmartImportManager to analyze third-party dependencies
+                        third_party_deps_needed = import_manager.analyze_third_party_dependencies(additional_imports)
+                        
+                        # Also analyze production imports for potential issues
+                        production_analysis = import_manager.analyze_production_imports(additional_imports, original_content)
+                        if production_analysis['recommendations']:
+                            for recommendation in production_analysis['recommendations']:
+                                logger.warning(f"  ⚠ Production import analysis: {recommendation}")
                         
-                        if dep['type'] == 'hamcrest':
-                            hamcrest_success, hamcrest_message = validator.ensure_hamcrest_dependency()
-                            if hamcrest_success:
-                                logger.info(f"  ✓ {dep['type'].upper()} dependency ready: {hamcrest_message}")
+                        # Add required dependencies before proceeding
+                        for dep in third_party_deps_needed:
+                            logger.info(f"  📚 Detected {dep['type'].upper()} usage, ensuring dependency is available...")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(f"    Required imports: {', '.join(dep['imports'])}")
+                            
+                            if dep['type'] == 'hamcrest':
+                                if hamcrest_ready:
+                                    logger.debug(f"  {dep['type'].upper()} dependency already ensured for this strategy")
+                                    continue
+                                hamcrest_success, hamcrest_message = validator.ensure_hamcrest_dependency()
+                                if hamcrest_success:
+                                    hamcrest_ready = True
+                                    logger.info(f"  ✓ {dep['type'].upper()} dependency ready: {hamcrest_message}")
+                                else:
+                                    logger.error(f"  ❌ {dep['type'].upper()} dependency failed: {hamcrest_message}")
+                                    df.at[row_index, result_col] = "dependency_failed"
+                                    execution_summary['test_failures'].append({
+                                        'strategy': strategy,
+                                        'test': test_full_name,
+                                        'reason': f'{dep["type"].title()} dependency failed: {hamcrest_message}'
+                                    })
+                                    dependency_failed = True
+                                    break
+                            # TODO: Add handling for other dependency types (mockito, etc.)
                             else:
-                                logger.error(f"  ❌ {dep['type'].upper()} dependency failed: {hamcrest_message}")
-                                df.loc[df.index == row.name, result_col] = "dependency_failed"
-                                execution_summary['test_failures'].append({
-                                    'strategy': strategy,
-                                    'test': test_full_name,
-                                    'reason': f'{dep["type"].title()} dependency failed: {hamcrest_message}'
-                                })
-                                continue  # Skip this test case
-                        # TODO: Add handling for other dependency types (mockito, etc.)
-                        else:
-                            logger.warning(f"  ⚠ Unknown dependency type '{dep['type']}', skipping dependency check")
-                
-                # Use SmartImportManager for import integration
-                
-                # Add imports using SmartImportManager
-                if additional_imports:
-                    modified_content, import_success = import_manager.add_missing_imports(original_content, additional_imports)
-                    if not import_success:
-                        logger.warning(f"  ⚠ Import integration had issues for {row['test_method_name']}")
-                else:
-                    modified_content = original_content
+                                logger.warning(f"  ⚠ Unknown dependency type '{dep['type']}', skipping dependency check")
+                    
+                    if dependency_failed:
+                        continue  # Skip this test case
+                    
+                    integrations.append((row_index, row, target_method_for_removal, is_one_to_many, additional_imports))
                 
-                # Now integrate the code using the validator
-                success, final_content, _ = validator.integrate_refactored_method(
-                    test_path, target_method_for_removal, row[code_col], strategy,
-                    [], is_one_to_many,  # Pass empty imports since we already handled them
-                    debug_mode=debug_mode
-                )
+                if not integrations:
+                    continue
                 
-                if success:
-                    # Use our content with proper imports
-                    lines = final_content.split('\n')
-                    original_lines = modified_content.split('\n')
+                # Integrate every refactoring of the file and compile it once. If that compilation
+                # fails, retry one refactoring at a time so that only the refactorings which
+                # really break the build are marked as failed. Each batch is built from the
+                # original content, so writing it also restores the file.
+                pending_batches = [integrations]
+                while pending_batches:
+                    batch = pending_batches.pop(0)
+                    
+                    # Add the imports of every refactoring in this batch using SmartImportManager (once)
+                    batch_imports = {}  # Ordered set of the imports needed by the batch
+                    for *_, row_imports in batch:
+                        batch_imports.update(dict.fromkeys(row_imports))
+                    if batch_imports:
+                        modified_content, import_success = import_manager.add_missing_imports(original_content, list(batch_imports))
+                        if not import_success:
+                            logger.warning(f"  ⚠ Import integration had issues for {test_path.name}")
+                    else:
+                        modified_content = original_content
                     
-                    # Find the imports section in both contents
-                    final_import_end = -1
-                    original_import_end = -1
+                    # Now integrate the batch's refactored methods using the validator
+                    final_content, integration_results = validator.integrate_refactored_methods(
+                        test_path,
+                        [(target, row[code_col], is_one_to_many) for _, row, target, is_one_to_many, _ in batch],
+                        strategy,
+                        debug_mode=debug_mode,
+                        content=original_content
+                    )
                     
-                    for i, line in enumerate(lines):
-                        if line.strip().startswith('import '):
-                            final_import_end = i
+                    integrated_rows = []
+                    for (row_index, row, *_), success in zip(batch, integration_results):
+                        if success:
+                            integrated_rows.append((row_index, row))
+                            continue
+                        logger.warning(f"  ✗ Code integration failed for {row['test_method_name']}.")
+                        df.at[row_index, result_col] = "integration_failed"
+                        execution_summary['test_failures'].append({
+                            'strategy': strategy,
+                            'test': f"{row['test_class_name']}.{row['test_method_name']}",
+                            'reason': 'Code integration failed'
+                        })
                     
-                    for i, line in enumerate(original_lines):
-                        if line.strip().startswith('import '):
-                            original_import_end = i
+                    if not integrated_rows:
+                        continue
                     
-                    # Replace the imports section in final_content with our properly managed imports
-                    if final_import_end >= 0 and original_import_end >= 0:
-                        # Keep the package and imports from our managed content
-                        final_content = '\n'.join(original_lines[:original_import_end + 1] + lines[final_import_end + 1:])
+                    # Use our content with proper imports: keep the package and imports from our
+                    # managed content, followed by everything after the imports in the integrated content
+                    final_import_block = _IMPORT_SECTION_RE.match(final_content)
+                    original_import_block = _IMPORT_SECTION_RE.match(modified_content)
+                    if final_import_block and original_import_block:
+                        final_content = original_import_block.group(0) + final_content[final_import_block.end():]
                     
                     modified_content = final_content
-                
-                if not success:
-                    logger.warning(f"  ✗ Code integration failed for {row['test_method_name']}.")
-                    df.loc[df.index == row.name, result_col] = "integration_failed"
-                    execution_summary['test_failures'].append({
-                        'strategy': strategy,
-                        'test': test_full_name,
-                        'reason': 'Code integration failed'
-                    })
-                    continue
 
-                test_path.write_text(modified_content, encoding='utf-8')
-                
-                # Always perform incremental compilation for quality assurance
-                compile_success, compile_output = build_manager.build_system.incremental_compile([test_path])
-                if not compile_success:
-                        logger.warning(f"  ✗ Incremental compilation failed for {row['test_method_name']}.")
+                    test_path.write_text(modified_content, encoding='utf-8')
+                    
+                    # Always perform incremental compilation for quality assurance
+                    compile_success, compile_output = build_manager.build_system.incremental_compile([test_path])
+                    if not compile_success and len(integrated_rows) > 1:
+                        logger.warning(f"  ✗ Incremental compilation failed for {test_path.name}; "
+                                       f"retrying its {len(integrated_rows)} refactorings one at a time...")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(f"Compilation error details:\n{compile_output}")
+                        integrated_indexes = {row_index for row_index, _ in integrated_rows}
+                        pending_batches[:0] = [[integration] for integration in batch if integration[0] in integrated_indexes]
+                        continue
+                    
+                    if not compile_success:
+                        row_index, row = integrated_rows[0]
+                        logger.warning(f"  ✗ Incremental compilation failed for {row['test_method_name']} in {test_path.name}.")
                         logger.error(f"Compilation error details:\n{compile_output}")
-                        df.loc[df.index == row.name, result_col] = "compilation_failed"
+                        df.at[row_index, result_col] = "compilation_failed"
                         execution_summary['test_failures'].append({
                             'strategy': strategy,
-                            'test': test_full_name,
+                            'test': f"{row['test_class_name']}.{row['test_method_name']}",
                             'reason': 'Incremental compilation failed'
                         })
                         
                         # Extract module name from test path for better error tracking
-                        module_name = "unknown"
-                        for part in test_path.parts:
-                            if part in ['core', 'plugins'] or 'struts' in part or 'tiles' in part or 'samza' in part:
-                                module_name = part
-                                break
-                        execution_summary['failed_compilation_modules'].add(module_name)
+                        execution_summary['failed_compilation_modules'].add(_module_name_for_path(test_path))
                         
                         continue
+                    
+                    # Verify that the refactored methods actually exist in the integrated code
+                    existing_methods_in_file = _extract_method_names_from_code(modified_content)
                 
-                # Discover test methods to run from the result CSV
-                method_names_col = f'{prefix}_refactored_method_names'
-                if method_names_col in row and row[method_names_col]:
-                    refactored_methods = [method.strip() for method in row[method_names_col].split(',') if method.strip()]
-                else:
-                    refactored_methods = []
-
-                if not refactored_methods:
-                    logger.warning(f"  Could not find any refactored method names in result file.")
-                    df.loc[df.index == row.name, result_col] = "no_test_found"
-                    execution_summary['test_failures'].append({
-                        'strategy': strategy,
-                        'test': test_full_name,
-                        'reason': 'No refactored methods found'
-                    })
-                    continue
-
-                # Verify that the refactored methods actually exist in the integrated code
-                current_file_content = test_path.read_text(encoding='utf-8')
-                existing_methods_in_file = _extract_method_names_from_code(current_file_content)
-                
-                # Check which methods actually exist
-                found_methods = []
-                missing_methods = []
-                for method in refactored_methods:
-                    if method in existing_methods_in_file:
-                        found_methods.append(method)
-                    else:
-                        missing_methods.append(method)
-                        
-                if missing_methods:
-                    logger.warning(f"  ⚠ Methods not found in integrated file: {', '.join(missing_methods)}")
+                    for row_index, row in integrated_rows:
+                        test_full_name = f"{row['test_class_name']}.{row['test_method_name']}"
                     
-                if not found_methods:
-                    logger.error(f"  ✗ None of the refactored methods exist in the integrated file.")
-                    logger.error(f"    Expected: {', '.join(refactored_methods)}")
-                    logger.error(f"    Found methods: {', '.join(existing_methods_in_file)}")
-                    df.loc[df.index == row.name, result_col] = "method_not_found"
-                    execution_summary['test_failures'].append({
-                        'strategy': strategy,
-                        'test': test_full_name,
-                        'reason': f'Refactored methods not found in file: {", ".join(missing_methods)}'
-                    })
-                    continue
-
-                logger.info(f"  Running refactored test(s): {', '.join(found_methods)}")
-                if missing_methods:
-                    logger.info(f"  Skipping missing methods: {', '.join(missing_methods)}")
+                        # Discover test methods to run from the result CSV
+                        if method_names_col in row and row[method_names_col]:
+                            refactored_methods = [method.strip() for method in row[method_names_col].split(',') if method.strip()]
+                        else:
+                            refactored_methods = []
+
+                        if not refactored_methods:
+                            logger.warning(f"  Could not find any refactored method names in result file for {test_full_name}.")
+                            df.at[row_index, result_col] = "no_test_found"
+                            execution_summary['test_failures'].append({
+                                'strategy': strategy,
+                                'test': test_full_name,
+                                'reason': 'No refactored methods found'
+                            })
+                            continue
                     
-                all_passed = True
-                failed_methods = []
-                for method in found_methods:
-                    passed, output = validator.run_specific_test(row['test_class_name'], method, test_path)
-                    if not passed:
-                        all_passed = False
-                        failed_methods.append(method)
-                        logger.warning(f"  - Method '{method}' FAILED.")
-                        if debug_mode: logger.debug(f"Test output:\n{output}")
-                        # Continue to test other methods even if one fails
-                
-                test_result = "pass" if all_passed else "fail"
-                result_detail = test_result
-                if missing_methods:
-                    result_detail += f" (missing: {len(missing_methods)})"
-                if failed_methods:
-                    result_detail += f" (failed: {', '.join(failed_methods)})"
+                        # Check which methods actually exist
+                        found_methods = []
+                        missing_methods = []
+                        for method in refactored_methods:
+                            if method in existing_methods_in_file:
+                                found_methods.append(method)
+                            else:
+                                missing_methods.append(method)
+                            
+                        if missing_methods:
+                            logger.warning(f"  ⚠ Methods not found in integrated file: {', '.join(missing_methods)}")
+                        
+                        if not found_methods:
+                            logger.error(f"  ✗ None of the refactored methods exist in the integrated file.")
+                            logger.error(f"    Expected: {', '.join(refactored_methods)}")
+                            logger.error(f"    Found methods: {', '.join(existing_methods_in_file)}")
+                            df.at[row_index, result_col] = "method_not_found"
+                            execution_summary['test_failures'].append({
+                                'strategy': strategy,
+                                'test': test_full_name,
+                                'reason': f'Refactored methods not found in file: {", ".join(missing_methods)}'
+                            })
+                            continue
+
+                        logger.info(f"  Running refactored test(s) for {test_full_name}: {', '.join(found_methods)}")
+                        if missing_methods:
+                            logger.info(f"  Skipping missing methods: {', '.join(missing_methods)}")
+                        
+                        # Runs all methods in one build tool invocation where supported,
+                        # otherwise up to `parallel` separate invocations at a time
+                        outcomes = validator.run_specific_tests(row['test_class_name'], found_methods, test_path, parallel)
                     
-                logger.info(f"  ✓ Test result: {result_detail.upper()}")
-                df.loc[df.index == row.name, result_col] = test_result
-                
-                if all_passed and not missing_methods:
-                    execution_summary['successful_tests'].append({
-                        'strategy': strategy,
-                        'test': test_full_name,
-                        'methods': found_methods
-                    })
-                else:
-                    failure_reason = []
-                    if failed_methods:
-                        failure_reason.append(f'Failed methods: {", ".join(failed_methods)}')
-                    if missing_methods:
-                        failure_reason.append(f'Missing methods: {", ".join(missing_methods)}')
+                        all_passed = True
+                        failed_methods = []
+                        for method in found_methods:
+                            passed, output = outcomes[method]
+                            if not passed:
+                                all_passed = False
+                                failed_methods.append(method)
+                                logger.warning(f"  - Method '{method}' FAILED.")
+                                if logger.isEnabledFor(logging.DEBUG): logger.debug(f"Test output:\n{output}")
+                                # Continue to test other methods even if one fails
                     
-                    execution_summary['test_failures'].append({
-                        'strategy': strategy,
-                        'test': test_full_name,
-                        'reason': '; '.join(failure_reason)
-                    })
+                        test_result = "pass" if all_passed else "fail"
+                        result_detail = test_result
+                        if missing_methods:
+                            result_detail += f" (missing: {len(missing_methods)})"
+                        if failed_methods:
+                            result_detail += f" (failed: {', '.join(failed_methods)})"
+                        
+                        logger.info(f"  ✓ Test result: {result_detail.upper()}")
+                        df.at[row_index, result_col] = test_result
+                    
+                        if all_passed and not missing_methods:
+                            execution_summary['successful_tests'].append({
+                                'strategy': strategy,
+                                'test': test_full_name,
+                                'methods': found_methods
+                            })
+                        else:
+                            failure_reason = []
+                            if failed_methods:
+                                failure_reason.append(f'Failed methods: {", ".join(failed_methods)}')
+                            if missing_methods:
+                                failure_reason.append(f'Missing methods: {", ".join(missing_methods)}')
+                        
+                            execution_summary['test_failures'].append({
+                                'strategy': strategy,
+                                'test': test_full_name,
+                                'reason': '; '.join(failure_reason)
+                            })
+
+            # Save after each strategy so an interrupted run keeps the results tested so far
+            _save_results_csv(df, results_file)
         
-        # After all strategies are tested, save the final, updated dataframe
-        df.to_csv(results_file, index=False, quoting=csv.QUOTE_ALL)
         logger.info(f"\n✓ Execution results saved to {results_file}")
 
     finally:
@@ -708,6 +835,19 @@ def execution_test_phase(java_project_path: Path, output_path: Path,
     _display_execution_summary(execution_summary, project_name)
 
 
+def _module_name_for_path(test_path: Path) -> str:
+    """Name of the module a test file belongs to, or "unknown"."""
+    match = _MODULE_PART_RE.search(str(test_path))
+    return match.group(1) if match else "unknown"
+
+
+def _save_results_csv(df: 'pd.DataFrame', results_file: Path) -> None:
+    """Write the results frame atomically, so an interrupted write never truncates the CSV."""
+    temp_file = results_file.with_name(results_file.name + '.tmp')
+    df.to_csv(temp_file, index=False, quoting=csv.QUOTE_ALL)
+    os.replace(temp_file, results_file)
+
+
 def _display_execution_summary(summary: dict, project_name: str) -> None:
     """Display a comprehensive execution summary."""
     logger.info("\n" + "=" * 60)
@@ -733,36 +873,28 @@ def _display_execution_summary(summary: dict, project_name: str) -> None:
     # Test failures breakdown
     if summary['test_failures']:
         logger.info(f"\n❌ Failed Test Cases:")
-        failure_by_reason = {}
+        failure_by_reason = defaultdict(list)
         for failure in summary['test_failures']:
-            reason = failure['reason']
-            if reason not in failure_by_reason:
-                failure_by_reason[reason] = []
-            failure_by_reason[reason].append(f"{failure['strategy']}: {failure['test']}")
+            failure_by_reason[failure['reason']].append(f"      • {failure['strategy']}: {failure['test']}")
         
-        for reason, tests in failure_by_reason.items():
+        # One record per line keeps the debug log greppable; sorted for stable output
+        for reason, tests in sorted(failure_by_reason.items()):
             logger.info(f"   📋 {reason}:")
-            for test in tests:
-                logger.info(f"      • {test}")
+            for test in sorted(tests):
+                logger.info(test)
     
     # Successful tests
     if summary['successful_tests']:
         logger.info(f"\n✅ Successful Test Cases:")
-        success_by_strategy = {}
+        success_by_strategy = defaultdict(list)
         for success in summary['successful_tests']:
-            strategy = success['strategy']
-            if strategy not in success_by_strategy:
-                success_by_strategy[strategy] = []
-            success_by_strategy[strategy].append({
-                'test': success['test'],
-                'methods': success['methods']
-            })
+            methods_str = ', '.join(success['methods'])
+            success_by_strategy[success['strategy']].append(f"      • {success['test']} → [{methods_str}]")
         
-        for strategy, tests in success_by_strategy.items():
+        for strategy, tests in sorted(success_by_strategy.items()):
             logger.info(f"   📋 {strategy.upper()} Strategy:")
-            for test_info in tests:
-                methods_str = ', '.join(test_info['methods'])
-                logger.info(f"      • {test_info['test']} → [{methods_str}]")
+            for test in sorted(tests):
+                logger.info(test)
     
     # Success rate
     if summary['total_tests_run'] > 0:
@@ -777,22 +909,22 @@ def _extract_method_names_from_code(code_content: str) -> List[str]:
     if not code_content:
         return []
     
-    # Regex to find method declarations in Java
-    # Matches: @Test or public/private/protected + return_type + method_name + (
-    method_pattern = re.compile(
-        r'(?:@Test\s+)?(?:public|private|protected)\s+(?:static\s+)?(?:[\w<>\[\]]+\s+)*(\w+)\s*\(',
-        re.MULTILINE
-    )
-    
-    methods = method_pattern.findall(code_content)
+    return list(_extract_method_names_cached(code_content))
+
+@lru_cache(maxsize=1024)
+def _extract_method_names_cached(code_content: str) -> Tuple[str, ...]:
+    """Method names of the given code; the same content is often parsed once per strategy."""
+    methods = _JAVA_METHOD_RE.findall(code_content)
     # Filter out common non-method matches like constructors or getters
-    filtered_methods = [m for m in methods if not m[0].isupper()]  # Exclude constructors
-    
-    return filtered_methods
+    return tuple(m for m in methods if not m[0].isupper())  # Exclude constructors
+
+@lru_cache(maxsize=1024)
+def _void_method_signature_re(method_name: str) -> re.Pattern:
+    """Compiled regex matching the `void name(` signature of a method."""
+    return re.compile(rf'\bvoid\s+{re.escape(method_name)}\s*\(')
 
 def _rename_methods_if_needed(code: str, original_method_name: str, strategy: str, existing_methods: set) -> str:
     """Rename methods in code if they conflict with existing methods."""
-    import re
     method_names = _extract_method_names_from_code(code)
     
     for method_name in method_names:
@@ -800,8 +932,7 @@ def _rename_methods_if_needed(code: str, original_method_name: str, strategy: st
             # Add strategy suffix
             new_name = f"{method_name}_{strategy}_refactored"
             # Replace method name in code
-            pattern = re.compile(rf'\bvoid\s+{re.escape(method_name)}\s*\(')
-            code = pattern.sub(f'void {new_name}(', code)
+            code = _void_method_signature_re(method_name).sub(f'void {new_name}(', code)
             logger.info(f"    Renamed {method_name} → {new_name}")
     
     return code
@@ -832,15 +963,29 @@ def show_refactored_phase(java_project_path: Path, output_path: Path, debug_mode
         logger.warning(f"No exact match found for project '{java_project_name}', using: {results_file}")
         logger.info(f"Available result files: {[f.name for f in result_files]}")
 
-    df = pd.read_csv(results_file)
-    df.fillna('', inplace=True)
+    import pandas as pd
+    from .executor import ResultsRecorder
+
+    df = pd.read_csv(results_file, dtype=str, na_filter=False, keep_default_na=False)
     
     validator = CodeValidator(java_project_path)
     backup_mgr = BackupManager()
     recorder = ResultsRecorder(output_path)
 
+    # One SmartImportManager for the whole project; its JUnit/Hamcrest detection does not depend on the file
+    from .import_manager import SmartImportManager
+    import_manager = SmartImportManager(java_project_path)
+
+    # Column names per strategy, for strategies present in the results
+    strategy_columns = [
+        (strategy, code_col, error_col, imports_col)
+        for strategy, _, code_col, error_col, imports_col, _, _ in recorder.STRATEGY_COLUMNS
+        if code_col in df.columns
+    ]
+
     # Group by test file to process efficiently
     file_groups = df.groupby('test_path')
+    pending_writes = {}  # test file path -> review-friendly content
     
     for test_file_path_str, group_df in file_groups:
         test_file_path = Path(test_file_path_str)
@@ -866,19 +1011,14 @@ def show_refactored_phase(java_project_path: Path, output_path: Path, debug_mode
             
             # Process each test method in this file
             method_refactorings = []  # Store refactorings for each method
-            for _, row in group_df.iterrows():
+            for row in group_df.to_dict('records'):
                 method_name = row['test_method_name']
                 logger.info(f"  Processing method: {method_name}")
                 
                 # Collect all successful refactorings for this method
                 refactorings = []
-                for strategy in recorder.STRATEGY_MAPPING.keys():
-                    prefix = recorder.STRATEGY_MAPPING[strategy]
-                    code_col = f'{prefix}_refactored_test_case_code'
-                    error_col = f'{prefix}_refactoring_error'
-                    imports_col = f'{prefix}_refactored_test_case_imports'
-                    
-                    if code_col in row and row[code_col] and not row[error_col]:
+                for strategy, code_col, error_col, imports_col in strategy_columns:
+                    if row[code_col] and not row[error_col]:
                         imports_str = row[imports_col]
                         additional_imports = [imp.strip() for imp in imports_str.split(',') if imp.strip()] if imports_str else []
                         
@@ -910,13 +1050,12 @@ def show_refactored_phase(java_project_path: Path, output_path: Path, debug_mode
                     logger.info(f"    No successful refactorings found for {method_name}")
             
             # Add all imports for this file using SmartImportManager (once)
+            all_file_imports = list(dict.fromkeys(all_file_imports))
             if all_file_imports:
                 # CRITICAL: Analyze imports for dependency requirements BEFORE adding them
                 logger.info(f"🔍 Analyzing {len(all_file_imports)} imports for dependency requirements...")
                 
                 # Use SmartImportManager for dependency analysis
-                from .import_manager import SmartImportManager
-                import_manager = SmartImportManager(java_project_path)
                 third_party_deps_needed = import_manager.analyze_third_party_dependencies(all_file_imports)
                 
                 # Add required dependencies before proceeding
@@ -939,21 +1078,22 @@ def show_refactored_phase(java_project_path: Path, output_path: Path, debug_mode
                 
                 if dependency_success:
                     # Use SmartImportManager for intelligent import handling
-                    from .import_manager import SmartImportManager
-                    import_manager = SmartImportManager(java_project_path)
                     modified_content, _ = import_manager.add_missing_imports(modified_content, all_file_imports)
                 else:
                     logger.error(f"❌ Dependency setup failed for file {test_file_path.name}, skipping import addition")
                     # Continue without adding imports that require missing dependencies
             
-            # Now insert the refactored methods
+            # Now insert the refactored methods. Spans are located in the content before any insertion
+            # and blocks are inserted bottom-up, so earlier insertions never shift later spans.
+            lines = modified_content.split('\n')
+            insertions = []  # (insertion_line, block)
+            method_spans = validator._find_method_spans(lines, [info['method_name'] for info in method_refactorings])
             for method_info in method_refactorings:
                 method_name = method_info['method_name']
                 refactorings = method_info['refactorings']
                 
                 # NEW LOGIC: Insert refactored methods after the original method (similar to execution phase)
-                lines = modified_content.split('\n')
-                start_line, end_line = validator._find_method_span(lines, method_name)
+                start_line, end_line = method_spans[method_name]
                 
                 if start_line == -1 or end_line == -1:
                     logger.warning(f"    Could not find original method '{method_name}' in the file. Skipping.")
@@ -992,14 +1132,17 @@ def show_refactored_phase(java_project_path: Path, output_path: Path, debug_mode
                 
                 # Insert all blocks right after the original method (not at class end)
                 full_insertion = '\n'.join(code_blocks)
-                insertion_line = end_line + 1
-                lines.insert(insertion_line, full_insertion)
-                modified_content = '\n'.join(lines)
+                insertions.append((end_line + 1, full_insertion))
                 
                 logger.info(f"    ✓ Added {len(refactorings)} refactoring(s) for {method_name} (inserted after original method)")
             
-            # Write modified content
-            test_file_path.write_text(modified_content, encoding='utf-8')
+            # Stable sort keeps blocks for the same line in the order sequential insertion would produce
+            for insertion_line, full_insertion in sorted(insertions, key=lambda insertion: -insertion[0]):
+                lines.insert(insertion_line, full_insertion)
+            modified_content = '\n'.join(lines)
+            
+            # Defer the write until every file has been processed
+            pending_writes[test_file_path] = modified_content
             
             if debug_mode:
                 logger.debug(f"\n--- Modified Content for {test_file_path} ---")
@@ -1010,6 +1153,19 @@ def show_refactored_phase(java_project_path: Path, output_path: Path, debug_mode
             logger.error(f"Error processing file {test_file_path}: {e}", exc_info=debug_mode)
             backup_mgr.restore_file(test_file_path)
     
+    # Write all modified files at once; the writes are independent and I/O bound
+    def _write_review_file(item: Tuple[Path, str]) -> None:
+        test_file_path, modified_content = item
+        try:
+            test_file_path.write_text(modified_content, encoding='utf-8')
+        except Exception as e:
+            logger.error(f"Error writing file {test_file_path}: {e}", exc_info=debug_mode)
+            backup_mgr.restore_file(test_file_path)
+    
+    if pending_writes:
+        with ThreadPoolExecutor(max_workers=min(len(pending_writes), os.cpu_count() or 1)) as executor:
+            list(executor.map(_write_review_file, pending_writes.items()))
+    
     logger.info(f"\n✓ Review-friendly code generation completed!")
     logger.info("📝 User can now review the refactored methods in the Java test files.")
     logger.info("💡 Use --keep-rf-in-project to prevent automatic restoration of original files.")
@@ -1017,7 +1173,7 @@ def show_refactored_phase(java_project_path: Path, output_path: Path, debug_mode
 
 
 def clean_refactored_phase(java_project_path: Path, debug_mode: bool = False) -> None:
-    """Clean up all refactored code and dependency changes using git checkout and backup restoration."""
+    """Clean up all refactored code and dependency changes using git restore and backup restoration."""
     logger.info("\nClean Refactored Code and Dependencies")
     logger.info("=" * 50)
     
@@ -1034,44 +1190,39 @@ def clean_refactored_phase(java_project_path: Path, debug_mode: bool = False) ->
             logger.debug("Error details:", exc_info=True)
     
     try:
-        import subprocess
-        
-        # Check if we're in a git repository
+        # Check git status for ALL modified files (not just Java); this also tells us whether
+        # we're in a git repository. NUL-separated output keeps paths with spaces or quotes verbatim.
         result = subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
+            ["git", "status", "--porcelain=v1", "-z"],
             cwd=java_project_path,
             capture_output=True,
             text=True,
-            timeout=10
+            timeout=30
         )
         
         if result.returncode != 0:
-            logger.error(f"Java project is not a git repository: {java_project_path}")
+            if "not a git repository" in result.stderr.lower():
+                logger.error(f"Java project is not a git repository: {java_project_path}")
+            else:
+                logger.error(f"Failed to check git status: {result.stderr}")
             logger.info("Attempting to restore remaining files from backup files...")
             _restore_from_backups_only(java_project_path, debug_mode)
             return
         
-        # Check git status for ALL modified files (not just Java)
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=java_project_path,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if result.returncode != 0:
-            logger.error(f"Failed to check git status: {result.stderr}")
-            return
-        
         # Separate different types of modified files
         java_files = []
         build_files = []
         other_files = []
         
-        for line in result.stdout.strip().split('\n'):
-            if line.strip() and (line.startswith(' M') or line.startswith('M ')):
-                filename = line[2:].strip()
+        entries = iter(result.stdout.split('\0'))
+        for entry in entries:
+            status = entry[:2]
+            if status[:1] in ('R', 'C'):
+                next(entries, None)  # Renames and copies are followed by their source path
+                continue
+            # Modified in the index, the working tree or both; added files have nothing to restore from HEAD
+            if 'M' in status and 'A' not in status:
+                filename = entry[3:]
                 if filename.endswith('.java'):
                     java_files.append(filename)
                 elif filename.endswith(('.xml', '.gradle', '.gradle.kts')):
@@ -1100,35 +1251,38 @@ def clean_refactored_phase(java_project_path: Path, debug_mode: bool = False) ->
         
         all_modified_files = java_files + build_files + other_files
         
-        # Use git checkout to restore all modified files
+        # Use git restore to reset all modified files in the index and working tree.
+        # Paths are passed on stdin, so the command line stays short however many files changed.
         logger.info("Restoring all modified files to their original state...")
         result = subprocess.run(
-            ["git", "checkout", "HEAD", "--"] + all_modified_files,
+            ["git", "restore", "--source=HEAD", "--staged", "--worktree",
+             "--pathspec-from-file=-", "--pathspec-file-nul"],
             cwd=java_project_path,
+            input='\0'.join(all_modified_files),
             capture_output=True,
             text=True,
             timeout=120
         )
         
         if result.returncode != 0:
-            logger.warning(f"Git checkout had issues: {result.stderr}")
+            logger.warning(f"Git restore had issues: {result.stderr}")
             logger.info("Attempting to restore from backup files as fallback...")
             _restore_from_backups_only(java_project_path, debug_mode)
         else:
-            logger.info(f"✓ Successfully restored {total_files} files using git checkout.")
+            logger.info(f"✓ Successfully restored {total_files} files using git restore.")
             # Also restore any backup files (for files that weren't tracked by git)
             _restore_from_backups_only(java_project_path, debug_mode)
         
         if debug_mode:
             # Show final git status
             result = subprocess.run(
-                ["git", "status", "--porcelain"],
+                ["git", "status", "--porcelain=v1", "-z"],
                 cwd=java_project_path,
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            remaining_modified = [line for line in result.stdout.strip().split('\n') if line.strip()]
+            remaining_modified = [entry for entry in result.stdout.split('\0') if entry]
             if remaining_modified:
                 logger.debug(f"Remaining modified files: {remaining_modified}")
             else:
@@ -1173,12 +1327,8 @@ def _restore_from_backups_only(java_project_path: Path, debug_mode: bool = False
             
             logger.info(f"  Restoring: {relative_original}")
             
-            # Copy backup content to original file
-            backup_content = backup_file.read_text(encoding='utf-8')
-            original_file.write_text(backup_content, encoding='utf-8')
-            
-            # Remove backup file
-            backup_file.unlink()
+            # Move backup content back over the original file (removes the backup)
+            os.replace(backup_file, original_file)
             
             restored_files.append(str(relative_original))
             
@@ -1333,6 +1483,17 @@ Examples:
         default=600,
         help="Maximum time in seconds to wait for automatic build (default: 600)"
     )
+    parser.add_argument(
+        "--parallel",
+        type=int,
+        default=1,
+        help="Number of refactored test methods to run concurrently during execution testing when the build system cannot run them in one invocation (default: 1)"
+    )
+    parser.add_argument(
+        "--serial-strategies",
+        action="store_true",
+        help="Run the refactoring strategies one after another in full pipeline mode instead of concurrently"
+    )
 
     parser.add_argument(
         "--input-file",
@@ -1416,7 +1577,7 @@ Examples:
             
         elif args.execution_test_only:
             logger.info("\nMode: Execution Test Only")
-            execution_test_phase(java_path, output_path, args.debug, args.keep_files, not args.no_fallback_manual, args.skip_initial_build)
+            execution_test_phase(java_path, output_path, args.debug, args.keep_files, not args.no_fallback_manual, args.skip_initial_build, args.parallel)
             
         elif args.pit_test_only:
             logger.info(f"\nMode: PIT Test Only ({args.rftype.upper()} strategy)")
@@ -1432,6 +1593,7 @@ Examples:
             
         else:
             # Full pipeline execution
+            from .executor import ResultsRecorder
             logger.info("\nMode: Full Pipeline")
             
             # Phase 1: Discovery
@@ -1442,14 +1604,29 @@ Examples:
             strategies_to_run = [args.rftype] if args.rftype else ['aaa', 'dsl', 'testsmell']
             logger.info(f"Will run refactoring for strategies: {', '.join(strategies_to_run)}")
             
+            known_strategies = []
             for strategy in strategies_to_run:
                 if strategy not in ResultsRecorder.STRATEGY_MAPPING:
                     logger.warning(f"Unknown strategy '{strategy}', skipping.")
                     continue
-                refactoring_phase(test_cases, java_path, data_path, output_path, strategy, args.debug)
+                known_strategies.append(strategy)
+            
+            if args.serial_strategies or len(known_strategies) <= 1:
+                for strategy in known_strategies:
+                    refactoring_phase(test_cases, java_path, data_path, output_path, strategy, args.debug)
+            else:
+                # Strategies are independent and LLM-bound, so run them side by side;
+                # each thread tags its log lines with the strategy name
+                with ThreadPoolExecutor(max_workers=len(known_strategies)) as executor:
+                    futures = [
+                        executor.submit(_tagged_refactoring_phase, test_cases, java_path, data_path, output_path, strategy, args.debug)
+                        for strategy in known_strategies
+                    ]
+                    for future in futures:
+                        future.result()
             
             # Phase 3: Execution Testing
-            execution_test_phase(java_path, output_path, args.debug, args.keep_files, not args.no_fallback_manual, args.skip_initial_build)
+            execution_test_phase(java_path, output_path, args.debug, args.keep_files, not args.no_fallback_manual, args.skip_initial_build, args.parallel)
             
             # Phase 4: PIT Testing
             for strategy in strategies_to_run:
@@ -1,13 +1,40 @@
 """Dependency management for adding temporary test dependencies."""
 
-import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
+import os
 import re
+import shutil
+import threading
 
 logger = logging.getLogger('aif')
 
+# Hamcrest detection results shared across DependencyManager instances, keyed by
+# project and the stat signature of every file detection reads
+_hamcrest_detection_cache: Dict[Tuple, Dict[str, Any]] = {}
+_HAMCREST_DETECTION_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=128)
+def _detect_build_system_cached(project_path: Path) -> str:
+    """Detect the build system of a project, once per path across DependencyManager instances."""
+    if (project_path / "pom.xml").exists():
+        return "maven"
+    if any((project_path / name).exists() for name in DependencyManager.GRADLE_ROOT_FILES):
+        return "gradle"
+    
+    # Nested Gradle builds without root files; stop at the first build file found
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = [d for d in dirs if DependencyManager._is_walked_dir(d)]
+        if any(name.startswith("build.gradle") for name in files):
+            return "gradle"
+    
+    return "unknown"
+
+
 class DependencyManager:
     """Manages temporary dependency additions for Maven and Gradle projects."""
     
@@ -25,26 +52,149 @@ class DependencyManager:
     MAVEN_START_MARKER = "        <!-- AAA-Issue-Refactor: Hamcrest dependency START -->"
     MAVEN_END_MARKER = "        <!-- AAA-Issue-Refactor: Hamcrest dependency END -->"
     
+    # Marked dependency block as inserted into an existing <dependencies> section
+    MAVEN_HAMCREST_BLOCK = f"{MAVEN_START_MARKER}\n{HAMCREST_MAVEN_DEPENDENCY}\n{MAVEN_END_MARKER}"
+    
+    # Line-leading <plugin>/<dependencies> open and close tags in a POM
+    MAVEN_SECTION_TAG_PATTERN = re.compile(r'^[ \t]*<(/?)(plugin|dependencies)(?=[\s>])', re.MULTILINE)
+    
+    # Lines that hold nothing but a closing </properties> or </project> tag
+    MAVEN_PROPERTIES_END_PATTERN = re.compile(r'^([^\S\n]*)</properties>[^\S\n]*$', re.MULTILINE)
+    MAVEN_PROJECT_END_PATTERN = re.compile(r'^[^\S\n]*</project>[^\S\n]*$', re.MULTILINE)
+    
+    # Stripped line that opens a Gradle dependencies block (brace on this or the next line)
+    GRADLE_DEPENDENCIES_START_PATTERN = re.compile(r'^dependencies\s*(?:\{|$)')
+    # The same line located within the whole file content
+    GRADLE_DEPENDENCIES_LINE_PATTERN = re.compile(r'^[^\S\n]*dependencies[^\S\n]*(?:\{|$)', re.MULTILINE)
+    
+    # hamcrestVersion definition in Gradle version files
+    HAMCREST_VERSION_PATTERN = re.compile(r'hamcrestVersion\s*=\s*["\']([^"\']+)["\']')
+    
+    # Hamcrest artifacts in the order they are checked; a later match overrides the format
+    GRADLE_HAMCREST_FORMATS = ("hamcrest", "hamcrest-all", "hamcrest-core", "hamcrest-library")
+    MAVEN_HAMCREST_FORMATS = ("hamcrest", "hamcrest-all", "hamcrest-core")
+    
+    # Hamcrest dependency declarations in Gradle build files, one alternation for all artifacts
+    GRADLE_HAMCREST_PATTERN = re.compile(
+        r'["\']org\.hamcrest:(hamcrest|hamcrest-all|hamcrest-core|hamcrest-library):([^"\']+)["\']'
+    )
+    
+    # Hamcrest dependency declarations in Maven POMs, one alternation for all artifacts
+    MAVEN_HAMCREST_PATTERN = re.compile(
+        r'<groupId>org\.hamcrest</groupId>\s*<artifactId>(hamcrest|hamcrest-all|hamcrest-core)</artifactId>\s*<version>([^<]+)</version>',
+        re.DOTALL
+    )
+    
+    # Modern (2.x) Hamcrest in a Maven POM: an explicit hamcrest 2.x artifact, or any
+    # "hamcrest ... 2.N" mention. A groupId-qualified declaration always contains the former.
+    MAVEN_MODERN_HAMCREST_PATTERN = re.compile(
+        r'<artifactId>\s*hamcrest\s*</artifactId>\s*<version>\s*2\.|hamcrest.*?2\.[0-9]',
+        re.IGNORECASE | re.MULTILINE | re.DOTALL
+    )
+    
+    # Modern (2.x) Hamcrest in a Gradle build file
+    GRADLE_MODERN_HAMCREST_PATTERNS = [
+        re.compile(r'hamcrest:2\.[0-9]', re.IGNORECASE),
+        re.compile(r'org\.hamcrest.*?hamcrest.*?2\.[0-9]', re.IGNORECASE),
+    ]
+    
+    # Our own marker comment in a Gradle build file
+    GRADLE_HAMCREST_MARKER_PATTERN = re.compile(r'AAA-Issue-Refactor.*hamcrest', re.IGNORECASE)
+    
+    # Gradle files holding a hamcrestVersion definition, relative to the project root
+    GRADLE_VERSION_FILES = (Path("gradle") / "dependency-versions.gradle", Path("gradle.properties"))
+    
+    # Root files that identify a Gradle build without walking the tree
+    GRADLE_ROOT_FILES = ("build.gradle", "build.gradle.kts", "settings.gradle", "settings.gradle.kts")
+    
+    # Directories that never hold project build files; pruned while walking
+    PRUNED_DIR_NAMES = frozenset({".git", ".gradle", ".idea", "node_modules"})
+    
     def __init__(self, project_path: Path):
         self.project_path = project_path
+        self._build_files: Optional[Dict[str, List[Path]]] = None  # Filled lazily by _scan_project
         self.build_system = self._detect_build_system()
-        self.backup_files: List[Path] = []
+        self.backup_files: List[Tuple[Path, Path]] = []  # (original, backup) pairs
+        self._backup_lock = threading.Lock()
+        self._maven_edit_cache: Dict[str, Optional[str]] = {}  # pom content -> modified content
+        self._content_cache: Dict[Path, str] = {}  # build file -> content read during detection
         self.existing_hamcrest_info = None  # Will store detected Hamcrest info
         
     def _detect_build_system(self) -> str:
         """Detect the build system used."""
-        if (self.project_path / "pom.xml").exists():
-            return "maven"
-        elif any(self.project_path.glob("**/build.gradle*")):
-            return "gradle"
-        else:
-            return "unknown"
+        return _detect_build_system_cached(self.project_path.resolve())
+    
+    @classmethod
+    def _is_walked_dir(cls, dir_name: str) -> bool:
+        """Check whether a directory should be descended into when looking for build files."""
+        return dir_name not in cls.PRUNED_DIR_NAMES and 'backup' not in dir_name.lower()
+    
+    def _scan_project(self) -> Dict[str, List[Path]]:
+        """
+        Walk the project once, collecting pom.xml and build.gradle* files.
+        
+        Backup directories and PRUNED_DIR_NAMES are pruned while walking
+        instead of being filtered out afterwards. The result is cached for
+        the lifetime of the manager.
+        """
+        if self._build_files is None:
+            poms: List[Path] = []
+            gradle_files: List[Path] = []
+            
+            for root, dirs, files in os.walk(self.project_path):
+                dirs[:] = [d for d in dirs if self._is_walked_dir(d)]
+                for name in files:
+                    if name == "pom.xml":
+                        poms.append(Path(root) / name)
+                    elif name.startswith("build.gradle"):
+                        gradle_files.append(Path(root) / name)
+            
+            self._build_files = {"maven": poms, "gradle": gradle_files}
+        
+        return self._build_files
     
     def _detect_existing_hamcrest_dependency(self) -> Dict[str, Any]:
         """
         Detect existing Hamcrest dependencies in the project.
         Returns info about existing Hamcrest versions and formats.
+        
+        Results are reused across instances while none of the inspected files
+        changed on disk.
         """
+        self._content_cache.clear()
+        cache_key = self._hamcrest_detection_key()
+        cached_info = _hamcrest_detection_cache.get(cache_key)
+        if cached_info is not None:
+            return dict(cached_info, files_checked=list(cached_info["files_checked"]))
+        
+        hamcrest_info = self._detect_hamcrest_uncached()
+        if len(_hamcrest_detection_cache) >= _HAMCREST_DETECTION_CACHE_SIZE:
+            _hamcrest_detection_cache.clear()
+        _hamcrest_detection_cache[cache_key] = dict(hamcrest_info, files_checked=list(hamcrest_info["files_checked"]))
+        return hamcrest_info
+    
+    def _hamcrest_detection_key(self) -> Tuple:
+        """Build the detection cache key from the stat signature of every file detection reads."""
+        if self.build_system == "gradle":
+            detection_files = [self.project_path / "build.gradle"]
+            detection_files += [self.project_path / name for name in self.GRADLE_VERSION_FILES]
+        elif self.build_system == "maven":
+            detection_files = self._scan_project()["maven"]
+        else:
+            detection_files = []
+        
+        signature = []
+        for file_path in detection_files:
+            try:
+                stat_result = os.stat(file_path)
+                signature.append((str(file_path), stat_result.st_mtime_ns, stat_result.st_size))
+            except OSError:
+                signature.append((str(file_path), None, None))
+        
+        return str(self.project_path.resolve()), self.build_system, tuple(signature)
+    
+    def _detect_hamcrest_uncached(self) -> Dict[str, Any]:
+        """Run Hamcrest detection for the current build system."""
         hamcrest_info = {
             "exists": False,
             "version": None,
@@ -64,75 +214,63 @@ class DependencyManager:
         """Detect Hamcrest in Gradle projects."""
         # Check main build.gradle
         main_build_gradle = self.project_path / "build.gradle"
-        if main_build_gradle.exists():
+        try:
+            content = self._read_cached_build_file(main_build_gradle)
+        except FileNotFoundError:
+            content = None
+        if content is not None:
             hamcrest_info["files_checked"].append(str(main_build_gradle))
-            content = main_build_gradle.read_text(encoding='utf-8')
             self._parse_gradle_hamcrest(content, hamcrest_info)
         
         # Check dependency version files
-        dep_version_files = [
-            self.project_path / "gradle" / "dependency-versions.gradle",
-            self.project_path / "gradle.properties"
-        ]
+        dep_version_files = [self.project_path / name for name in self.GRADLE_VERSION_FILES]
         
         for dep_file in dep_version_files:
-            if dep_file.exists():
-                hamcrest_info["files_checked"].append(str(dep_file))
-                content = dep_file.read_text(encoding='utf-8')
-                # Look for hamcrestVersion definition
-                version_match = re.search(r'hamcrestVersion\s*=\s*["\']([^"\']+)["\']', content)
-                if version_match:
-                    hamcrest_info["version"] = version_match.group(1)
-        
-        # Check if all subproject build files
-        for gradle_file in self.project_path.glob("**/build.gradle*"):
-            if "build" in str(gradle_file) or ".gradle" in str(gradle_file).replace(str(gradle_file.name), ""):
-                continue  # Skip build output directories
-            hamcrest_info["files_checked"].append(str(gradle_file))
-            content = gradle_file.read_text(encoding='utf-8')
-            self._parse_gradle_hamcrest(content, hamcrest_info)
-        
+            try:
+                content = self._read_build_file(dep_file)
+            except FileNotFoundError:
+                continue
+            hamcrest_info["files_checked"].append(str(dep_file))
+            # Look for hamcrestVersion definition
+            version_match = self.HAMCREST_VERSION_PATTERN.search(content)
+            if version_match:
+                hamcrest_info["version"] = version_match.group(1)
+        
+        # Subproject build files are not inspected here; _process_one_gradle checks
+        # each of them for modern Hamcrest before editing it
         return hamcrest_info
     
     def _parse_gradle_hamcrest(self, content: str, hamcrest_info: Dict[str, Any]):
         """Parse Gradle build file content for Hamcrest dependencies."""
-        # Look for various Hamcrest dependency patterns
-        hamcrest_patterns = [
-            (r'["\']org\.hamcrest:hamcrest:([^"\']+)["\']', "hamcrest"),
-            (r'["\']org\.hamcrest:hamcrest-all:([^"\']+)["\']', "hamcrest-all"),
-            (r'["\']org\.hamcrest:hamcrest-core:([^"\']+)["\']', "hamcrest-core"),
-            (r'["\']org\.hamcrest:hamcrest-library:([^"\']+)["\']', "hamcrest-library"),
-        ]
-        
-        for pattern, format_type in hamcrest_patterns:
-            matches = re.findall(pattern, content)
-            if matches:
+        # Every pattern below mentions hamcrest; skip the regex scans otherwise
+        if 'hamcrest' not in content:
+            return
+        
+        # Look for various Hamcrest dependency patterns in a single scan
+        first_versions = self._first_hamcrest_versions(self.GRADLE_HAMCREST_PATTERN, content)
+        for format_type in self.GRADLE_HAMCREST_FORMATS:
+            if format_type in first_versions:
                 hamcrest_info["exists"] = True
                 hamcrest_info["format"] = format_type
                 # Use version from dependency if not found in version file
-                if not hamcrest_info["version"] and matches:
-                    version = matches[0]
+                if not hamcrest_info["version"]:
+                    version = first_versions[format_type]
                     # Handle variable references like $hamcrestVersion
                     if version.startswith('$'):
                         continue  # Will be resolved from version file
                     hamcrest_info["version"] = version
         
         # Check for variable usage like $hamcrestVersion
-        if re.search(r'\$hamcrestVersion', content) and not hamcrest_info["exists"]:
+        if '$hamcrestVersion' in content and not hamcrest_info["exists"]:
             hamcrest_info["exists"] = True  # Mark as existing if variable is used
     
     def _detect_hamcrest_maven(self, hamcrest_info: Dict[str, Any]) -> Dict[str, Any]:
         """Detect Hamcrest in Maven projects."""
-        # Find all pom.xml files
-        pom_files = list(self.project_path.glob("**/pom.xml"))
-        
-        for pom_file in pom_files:
-            if '.backup' in str(pom_file) or 'backup' in str(pom_file).lower():
-                continue
-            
+        # Find all pom.xml files (backup directories are already pruned)
+        for pom_file in self._scan_project()["maven"]:
             hamcrest_info["files_checked"].append(str(pom_file))
             try:
-                content = pom_file.read_text(encoding='utf-8')
+                content = self._read_cached_build_file(pom_file)
                 self._parse_maven_hamcrest(content, hamcrest_info)
             except Exception as e:
                 logger.debug(f"Error reading {pom_file}: {e}")
@@ -142,22 +280,27 @@ class DependencyManager:
     
     def _parse_maven_hamcrest(self, content: str, hamcrest_info: Dict[str, Any]):
         """Parse Maven POM content for Hamcrest dependencies."""
-        # Look for Hamcrest dependencies in XML
-        hamcrest_patterns = [
-            (r'<groupId>org\.hamcrest</groupId>\s*<artifactId>hamcrest</artifactId>\s*<version>([^<]+)</version>', "hamcrest"),
-            (r'<groupId>org\.hamcrest</groupId>\s*<artifactId>hamcrest-all</artifactId>\s*<version>([^<]+)</version>', "hamcrest-all"),
-            (r'<groupId>org\.hamcrest</groupId>\s*<artifactId>hamcrest-core</artifactId>\s*<version>([^<]+)</version>', "hamcrest-core"),
-        ]
-        
-        for pattern, format_type in hamcrest_patterns:
-            matches = re.findall(pattern, content, re.DOTALL)
-            if matches:
+        if 'org.hamcrest' not in content:
+            return
+        
+        # Look for Hamcrest dependencies in XML in a single scan
+        first_versions = self._first_hamcrest_versions(self.MAVEN_HAMCREST_PATTERN, content)
+        for format_type in self.MAVEN_HAMCREST_FORMATS:
+            if format_type in first_versions:
                 hamcrest_info["exists"] = True
                 hamcrest_info["format"] = format_type
-                version = matches[0].strip()
+                version = first_versions[format_type].strip()
                 if not version.startswith('${') and not hamcrest_info["version"]:
                     hamcrest_info["version"] = version
     
+    @staticmethod
+    def _first_hamcrest_versions(pattern: "re.Pattern", content: str) -> Dict[str, str]:
+        """Map each Hamcrest artifact matched by pattern to its first declared version."""
+        first_versions: Dict[str, str] = {}
+        for match in pattern.finditer(content):
+            first_versions.setdefault(match.group(1), match.group(2))
+        return first_versions
+    
     def _is_hamcrest_compatible(self, hamcrest_info: Dict[str, Any]) -> bool:
         """
         Check if existing Hamcrest is compatible with our needs.
@@ -214,58 +357,21 @@ class DependencyManager:
     
     def _add_hamcrest_maven_all_modules(self) -> Tuple[bool, str]:
         """Add Hamcrest dependency to all Maven pom.xml files found in the project."""
-        # Find all pom.xml files in the project
-        all_poms = list(self.project_path.glob("**/pom.xml"))
+        # Find all pom.xml files in the project (backup directories are already pruned)
+        poms = self._scan_project()["maven"]
         
-        if not all_poms:
+        if not poms:
             return False, "No pom.xml files found"
         
-        logger.info(f"Found {len(all_poms)} pom.xml files to process")
+        logger.info(f"Found {len(poms)} pom.xml files to process")
         
-        modified_files = []
-        already_present = []
-        failed_files = []
+        # Build files are independent, so read/backup/rewrite them concurrently
+        with ThreadPoolExecutor(max_workers=self._file_workers()) as executor:
+            results = list(executor.map(self._process_one_pom, poms))
         
-        for pom_file in all_poms:
-            try:
-                # Skip backup directories to avoid modifying backups
-                if '.aif_backup' in str(pom_file) or 'backup' in str(pom_file).lower():
-                    continue
-                
-                relative_path = pom_file.relative_to(self.project_path)
-                logger.debug(f"Processing: {relative_path}")
-                
-                # Backup original file
-                self._backup_file(pom_file)
-                
-                content = pom_file.read_text(encoding='utf-8')
-                
-                # Check if hamcrest is already present
-                if self._is_hamcrest_present_maven(content):
-                    logger.debug(f"  Hamcrest already present in {relative_path}")
-                    already_present.append(str(relative_path))
-                    continue
-                
-                # Check if our marker is already present
-                if self.MAVEN_START_MARKER in content:
-                    logger.debug(f"  Our Hamcrest already added to {relative_path}")
-                    already_present.append(str(relative_path))
-                    continue
-                
-                # Try to add hamcrest
-                modified_content = self._insert_hamcrest_maven_minimal(content)
-                
-                if modified_content != content:
-                    pom_file.write_text(modified_content, encoding='utf-8')
-                    modified_files.append(str(relative_path))
-                    logger.debug(f"  ✓ Added Hamcrest to {relative_path}")
-                else:
-                    logger.debug(f"  ✗ Could not modify {relative_path}")
-                    failed_files.append(str(relative_path))
-                    
-            except Exception as e:
-                logger.error(f"Failed to process {pom_file}: {e}")
-                failed_files.append(str(pom_file.relative_to(self.project_path)))
+        modified_files = [path for status, path in results if status == "modified"]
+        already_present = [path for status, path in results if status == "present"]
+        failed_files = [path for status, path in results if status == "failed"]
         
         # Create summary message
         summary_parts = []
@@ -282,6 +388,66 @@ class DependencyManager:
         else:
             return False, f"Failed to add Hamcrest to any modules: {'; '.join(summary_parts)}"
     
+    def _file_workers(self) -> int:
+        """Number of threads used to process build files concurrently."""
+        return max(1, (os.cpu_count() or 4) - 2)
+    
+    def _maven_modified_content(self, content: str) -> Optional[str]:
+        """
+        Return pom content with Hamcrest added, or None if it is already present.
+        
+        Results are cached by content: sibling modules often share identical
+        poms, and those only need to be analysed once.
+        """
+        if content in self._maven_edit_cache:
+            return self._maven_edit_cache[content]
+        
+        if self._is_hamcrest_present_maven(content):
+            modified_content = None
+        else:
+            modified_content = self._insert_hamcrest_maven_minimal(content)
+        
+        self._maven_edit_cache[content] = modified_content
+        return modified_content
+    
+    def _process_one_pom(self, pom_file: Path) -> Tuple[str, str]:
+        """
+        Add Hamcrest to a single pom.xml.
+        
+        Returns:
+            ("modified" | "present" | "failed", relative path)
+        """
+        try:
+            relative_path = str(pom_file.relative_to(self.project_path))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing: {relative_path}")
+            
+            content = self._take_build_file(pom_file)
+            
+            # Check if hamcrest (or our marker) is already present, otherwise try to add it
+            modified_content = self._maven_modified_content(content)
+            
+            if modified_content is None:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"  Hamcrest already present in {relative_path}")
+                return "present", relative_path
+            
+            if modified_content != content:
+                # Only files we actually rewrite need a backup
+                self._backup_file(pom_file)
+                self._write_build_file(pom_file, modified_content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"  ✓ Added Hamcrest to {relative_path}")
+                return "modified", relative_path
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"  ✗ Could not modify {relative_path}")
+            return "failed", relative_path
+            
+        except Exception as e:
+            logger.error(f"Failed to process {pom_file}: {e}")
+            return "failed", str(pom_file.relative_to(self.project_path))
+    
     def _add_hamcrest_gradle_all_modules(self) -> Tuple[bool, str]:
         """Add Hamcrest dependency to all Gradle build files found in the project."""
         # If compatible Hamcrest already exists, don't add new dependencies
@@ -290,85 +456,46 @@ class DependencyManager:
             self._is_hamcrest_compatible(self.existing_hamcrest_info)):
             return True, f"Using existing compatible Hamcrest: {self.existing_hamcrest_info['format']}:{self.existing_hamcrest_info['version']}"
         
-        # Find all build.gradle and build.gradle.kts files
-        gradle_files = []
-        
-        # Add main build.gradle if it exists
-        main_gradle = self.project_path / "build.gradle"
-        if main_gradle.exists():
-            gradle_files.append(main_gradle)
-        
-        # Add main build.gradle.kts if it exists
-        main_gradle_kts = self.project_path / "build.gradle.kts"
-        if main_gradle_kts.exists():
-            gradle_files.append(main_gradle_kts)
-        
-        # Find subproject build files (but skip build output directories)
-        for gradle_file in self.project_path.glob("**/build.gradle"):
-            if ("build/" in str(gradle_file) or 
-                "/.gradle/" in str(gradle_file) or
-                gradle_file == main_gradle):
+        # Find all build.gradle and build.gradle.kts files in one pass over the
+        # cached project walk, which also covers the root directory
+        main_files = (self.project_path / "build.gradle", self.project_path / "build.gradle.kts")
+        found_main_files = set()
+        subproject_files: Dict[str, List[Path]] = {"build.gradle": [], "build.gradle.kts": []}
+        for gradle_file in self._scan_project()["gradle"]:
+            if gradle_file in main_files:
+                found_main_files.add(gradle_file)
                 continue
-            gradle_files.append(gradle_file)
             
-        for gradle_file in self.project_path.glob("**/build.gradle.kts"):
-            if ("build/" in str(gradle_file) or 
-                "/.gradle/" in str(gradle_file) or
-                gradle_file == main_gradle_kts):
+            # Skip other build.gradle* names and build output directories
+            same_name_files = subproject_files.get(gradle_file.name)
+            if same_name_files is None:
+                continue
+            relative_dir = "/" + gradle_file.parent.relative_to(self.project_path).as_posix() + "/"
+            if "build/" in relative_dir or "/.gradle/" in relative_dir:
                 continue
-            gradle_files.append(gradle_file)
+            same_name_files.append(gradle_file)
+        
+        # Main build files come first, then subprojects grouped by file name
+        gradle_files = [main_file for main_file in main_files if main_file in found_main_files]
+        gradle_files += subproject_files["build.gradle"] + subproject_files["build.gradle.kts"]
         
         if not gradle_files:
             return False, "No build.gradle files found"
         
         logger.info(f"Found {len(gradle_files)} Gradle build files to process")
         
-        modified_files = []
-        already_present = []
-        failed_files = []
-        
         # Special handling for projects with existing Hamcrest
         hamcrest_upgrade_strategy = self._determine_hamcrest_upgrade_strategy()
         
-        for gradle_file in gradle_files:
-            try:
-                # Skip backup directories
-                if '.aif_backup' in str(gradle_file) or 'backup' in str(gradle_file).lower():
-                    continue
-                
-                relative_path = gradle_file.relative_to(self.project_path)
-                logger.debug(f"Processing: {relative_path}")
-                
-                # Backup original file
-                self._backup_file(gradle_file)
-                
-                content = gradle_file.read_text(encoding='utf-8')
-                
-                # Check if modern hamcrest is already present
-                if self._is_modern_hamcrest_present_gradle(content):
-                    logger.debug(f"  Modern Hamcrest already present in {relative_path}")
-                    already_present.append(str(relative_path))
-                    continue
-                
-                # Try to add hamcrest based on the upgrade strategy
-                if hamcrest_upgrade_strategy == "skip":
-                    logger.debug(f"  Skipping {relative_path} - compatible Hamcrest exists")
-                    already_present.append(str(relative_path))
-                    continue
-                
-                modified_content = self._add_to_gradle_dependencies(content, hamcrest_upgrade_strategy)
-                
-                if modified_content != content:
-                    gradle_file.write_text(modified_content, encoding='utf-8')
-                    modified_files.append(str(relative_path))
-                    logger.debug(f"  ✓ Added Hamcrest to {relative_path}")
-                else:
-                    logger.debug(f"  ✗ Could not modify {relative_path} (no dependencies block found)")
-                    failed_files.append(str(relative_path))
-                    
-            except Exception as e:
-                logger.error(f"Failed to process {gradle_file}: {e}")
-                failed_files.append(str(gradle_file.relative_to(self.project_path)))
+        with ThreadPoolExecutor(max_workers=self._file_workers()) as executor:
+            results = list(executor.map(
+                lambda gradle_file: self._process_one_gradle(gradle_file, hamcrest_upgrade_strategy),
+                gradle_files
+            ))
+        
+        modified_files = [path for status, path in results if status == "modified"]
+        already_present = [path for status, path in results if status == "present"]
+        failed_files = [path for status, path in results if status == "failed"]
         
         # Create summary message
         summary_parts = []
@@ -385,6 +512,50 @@ class DependencyManager:
         else:
             return False, f"Failed to add Hamcrest to any modules: {'; '.join(summary_parts)}"
     
+    def _process_one_gradle(self, gradle_file: Path, hamcrest_upgrade_strategy: str) -> Tuple[str, str]:
+        """
+        Add Hamcrest to a single Gradle build file.
+        
+        Returns:
+            ("modified" | "present" | "failed", relative path)
+        """
+        try:
+            relative_path = str(gradle_file.relative_to(self.project_path))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Processing: {relative_path}")
+            
+            content = self._take_build_file(gradle_file)
+            
+            # Check if modern hamcrest is already present
+            if self._is_modern_hamcrest_present_gradle(content):
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"  Modern Hamcrest already present in {relative_path}")
+                return "present", relative_path
+            
+            # Try to add hamcrest based on the upgrade strategy
+            if hamcrest_upgrade_strategy == "skip":
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"  Skipping {relative_path} - compatible Hamcrest exists")
+                return "present", relative_path
+            
+            modified_content = self._add_to_gradle_dependencies(content, hamcrest_upgrade_strategy)
+            
+            if modified_content != content:
+                # Only files we actually rewrite need a backup
+                self._backup_file(gradle_file)
+                self._write_build_file(gradle_file, modified_content)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"  ✓ Added Hamcrest to {relative_path}")
+                return "modified", relative_path
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"  ✗ Could not modify {relative_path} (no dependencies block found)")
+            return "failed", relative_path
+            
+        except Exception as e:
+            logger.error(f"Failed to process {gradle_file}: {e}")
+            return "failed", str(gradle_file.relative_to(self.project_path))
+    
     def _determine_hamcrest_upgrade_strategy(self) -> str:
         """
         Determine the strategy for adding Hamcrest based on existing dependencies.
@@ -412,77 +583,48 @@ class DependencyManager:
     
     def _is_hamcrest_present_maven(self, content: str) -> bool:
         """Check if modern Hamcrest dependency is already present in Maven POM."""
-        # Look for Hamcrest 2.x dependency specifically
-        hamcrest_patterns = [
-            r'<groupId>\s*org\.hamcrest\s*</groupId>\s*<artifactId>\s*hamcrest\s*</artifactId>\s*<version>\s*2\.',
-            r'<artifactId>\s*hamcrest\s*</artifactId>\s*<version>\s*2\.',
-            r'hamcrest.*?2\.[0-9]',
-        ]
-        
-        for pattern in hamcrest_patterns:
-            if re.search(pattern, content, re.IGNORECASE | re.MULTILINE | re.DOTALL):
-                return True
+        # Most POMs never mention hamcrest; a substring check is far cheaper than the regexes
+        lowered = content.lower()
+        if 'hamcrest' not in lowered:
+            return False
         
         # Also check for our marker
         if self.MAVEN_START_MARKER in content:
             return True
-            
-        return False
+        
+        # Look for Hamcrest 2.x dependency specifically; both alternatives need a "2."
+        return '2.' in content and bool(self.MAVEN_MODERN_HAMCREST_PATTERN.search(content))
     
     def _is_modern_hamcrest_present_gradle(self, content: str) -> bool:
         """Check if modern Hamcrest dependency is already present in Gradle build file."""
-        # Look for modern hamcrest:2.x dependency
-        modern_patterns = [
-            r'hamcrest:2\.[0-9]',
-            r'org\.hamcrest.*?hamcrest.*?2\.[0-9]',
-            r'AAA-Issue-Refactor.*hamcrest',  # Our marker
-        ]
-        
-        for pattern in modern_patterns:
-            if re.search(pattern, content, re.IGNORECASE):
-                return True
+        if 'hamcrest' not in content.lower():
+            return False
         
-        return False
+        if self.GRADLE_HAMCREST_MARKER_PATTERN.search(content):
+            return True
+        
+        # Look for modern hamcrest:2.x dependency; every 2.x pattern needs a literal "2."
+        return '2.' in content and any(pattern.search(content) for pattern in self.GRADLE_MODERN_HAMCREST_PATTERNS)
     
     def _insert_hamcrest_maven_minimal(self, content: str) -> str:
         """Insert Hamcrest dependency using minimal string modification."""
-        lines = content.split('\n')
-        
-        # Find the dependencies section
+        # Find the first dependencies section outside of a plugin and its closing tag
         in_plugin = False
-        in_dependencies = False
-        dependencies_start = -1
-        dependencies_end = -1
-        indent = "        "  # Default Maven indent
+        dependencies_end = None
         
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            # Find start of plugin section
-            if stripped == '<plugin>' or stripped.startswith('<plugin '):
-                in_plugin = True
-            
-            # Find start of dependencies section
-            if not in_plugin and (stripped == '<dependencies>' or stripped.startswith('<dependencies ')):
-                in_dependencies = True
-                dependencies_start = i
-                # Extract indentation from the dependencies tag
-                match = re.match(r'^(\s*)', line)
-                if match:
-                    base_indent = match.group(1)
-                    indent = base_indent + "    "  # Add one level of indentation
-                continue
+        for match in self.MAVEN_SECTION_TAG_PATTERN.finditer(content):
+            closing, tag = match.group(1), match.group(2)
             
-            # Find end of plugin section
-            if in_plugin and stripped == '</plugin>':
-                in_plugin = False
-            
-            # Find end of dependencies section
-            if in_dependencies and stripped == '</dependencies>':
-                dependencies_end = i
+            if dependencies_end is None:
+                if tag == 'plugin':
+                    in_plugin = not closing
+                elif not closing and not in_plugin:
+                    dependencies_end = -1
+            elif tag == 'dependencies' and closing:
+                dependencies_end = match.start()
                 break
         
-        if dependencies_start == -1:
+        if dependencies_end is None:
             # No dependencies section found, need to create one
             return self._create_dependencies_section_maven(content)
         
@@ -490,154 +632,205 @@ class DependencyManager:
             # Malformed XML, dependencies section not closed
             return content
         
-        # Insert our dependency just before </dependencies>
-        hamcrest_block = [
-            self.MAVEN_START_MARKER,
-            self.HAMCREST_MAVEN_DEPENDENCY,
-            self.MAVEN_END_MARKER
-        ]
-        
-        # Insert at the end of dependencies section
-        for block_line in reversed(hamcrest_block):
-            lines.insert(dependencies_end, block_line)
-        
-        return '\n'.join(lines)
+        # Insert our dependency just before the </dependencies> line
+        return content[:dependencies_end] + self.MAVEN_HAMCREST_BLOCK + "\n" + content[dependencies_end:]
     
     def _create_dependencies_section_maven(self, content: str) -> str:
         """Create a new dependencies section if it doesn't exist."""
-        lines = content.split('\n')
-        
         # Find a good place to insert dependencies (after properties or before build)
-        insertion_point = -1
-        base_indent = "    "  # Default indent
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            
-            # Look for end of properties
-            if stripped == '</properties>':
-                insertion_point = i + 1
-                # Extract base indentation
-                match = re.match(r'^(\s*)', line)
-                if match:
-                    base_indent = match.group(1)
-                break
-        
-        if insertion_point == -1:
-            # Fallback: insert before </project>
-            for i, line in enumerate(lines):
-                if line.strip() == '</project>':
-                    insertion_point = i
-                    break
+        properties_end = self.MAVEN_PROPERTIES_END_PATTERN.search(content)
+        if properties_end:
+            base_indent = properties_end.group(1)
+            section = "\n\n" + self._maven_dependencies_section(base_indent)
+            return content[:properties_end.end()] + section + content[properties_end.end():]
+        
+        # Fallback: insert before </project>
+        project_end = self.MAVEN_PROJECT_END_PATTERN.search(content)
+        if project_end:
+            section = "\n" + self._maven_dependencies_section("    ") + "\n"
+            return content[:project_end.start()] + section + content[project_end.start():]
+        
+        return content  # Cannot find insertion point
+    
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _maven_dependencies_section(base_indent: str) -> str:
+        """Full <dependencies> section holding only our Hamcrest block, per indent."""
+        return f"{base_indent}<dependencies>\n{DependencyManager.MAVEN_HAMCREST_BLOCK}\n{base_indent}</dependencies>"
+    
+    def _add_to_gradle_dependencies(self, content: str, upgrade_strategy: str = "add") -> str:
+        """Add Hamcrest to Gradle dependencies block."""
+        # If upgrading, add modern Hamcrest alongside old. Only this path needs a
+        # line-by-line look at existing Hamcrest declarations.
+        if upgrade_strategy == "upgrade" and 'hamcrest' in content.lower():
+            lines = content.split('\n')
+            if self._upgrade_gradle_hamcrest_line(lines):
+                return '\n'.join(lines)
+        
+        # For "add" strategy or if no existing hamcrest found, add new dependency.
+        # Jump straight to the first dependencies line; everything above it is irrelevant.
+        block_start = self.GRADLE_DEPENDENCIES_LINE_PATTERN.search(content)
+        if not block_start:
+            return content
         
-        if insertion_point == -1:
-            return content  # Cannot find insertion point
+        # Only the text from that line on is split; the preamble is spliced back unchanged
+        head = content[:block_start.start()]
+        lines = content[block_start.start():].split('\n')
+        insertion_line, base_indent = self._find_gradle_insertion_point(lines, 0)
         
-        # Create full dependencies section
-        dependencies_section = [
-            "",  # Empty line for separation
-            f"{base_indent}<dependencies>",
-            self.MAVEN_START_MARKER,
-            self.HAMCREST_MAVEN_DEPENDENCY,
-            self.MAVEN_END_MARKER,
-            f"{base_indent}</dependencies>"
-        ]
+        if insertion_line != -1:
+            # Add comment and dependency
+            hamcrest_lines = [
+                f"{base_indent}// AAA-Issue-Refactor: Hamcrest dependency",
+                f"{base_indent}{self.HAMCREST_GRADLE}"
+            ]
+            
+            lines[insertion_line:insertion_line] = hamcrest_lines
+            
+            return head + '\n'.join(lines)
         
-        # Insert the section
-        for dep_line in reversed(dependencies_section):
-            lines.insert(insertion_point, dep_line)
+        return content
+    
+    def _upgrade_gradle_hamcrest_line(self, lines: List[str]) -> bool:
+        """Comment out the first old Hamcrest test dependency and add 2.2 after it."""
+        for i, line in enumerate(lines):
+            if ('hamcrest' in line.lower() and 
+                ('testCompile' in line or 'testImplementation' in line or 'testApi' in line) and
+                not 'AAA-Issue-Refactor' in line):
+                
+                # Found existing hamcrest dependency
+                indent = line[:len(line) - len(line.lstrip())]
+                
+                # Comment out old line and add new one
+                lines[i] = f'{indent}// {line.strip()}  // Commented out by AAA-Issue-Refactor'
+                new_line = f'{indent}testImplementation "org.hamcrest:hamcrest:2.2"  // Added by AAA-Issue-Refactor'
+                lines.insert(i + 1, new_line)
+                logger.debug(f"Upgraded hamcrest dependency to 2.2")
+                return True
         
-        return '\n'.join(lines)
+        return False
     
-    def _add_to_gradle_dependencies(self, content: str, upgrade_strategy: str = "add") -> str:
-        """Add Hamcrest to Gradle dependencies block."""
-        lines = content.split('\n')
-        
-        # If upgrading, add modern Hamcrest alongside old
-        if upgrade_strategy == "upgrade":
-            for i, line in enumerate(lines):
-                if ('hamcrest' in line.lower() and 
-                    ('testCompile' in line or 'testImplementation' in line or 'testApi' in line) and
-                    not 'AAA-Issue-Refactor' in line):
-                    
-                    # Found existing hamcrest dependency
-                    old_line = line
-                    # Extract indentation
-                    indent_match = re.match(r'^(\s*)', line)
-                    indent = indent_match.group(1) if indent_match else "    "
-                    
-                    # Comment out old line and add new one
-                    lines[i] = f'{indent}// {old_line.strip()}  // Commented out by AAA-Issue-Refactor'
-                    new_line = f'{indent}testImplementation "org.hamcrest:hamcrest:2.2"  // Added by AAA-Issue-Refactor'
-                    lines.insert(i + 1, new_line)
-                    logger.debug(f"Upgraded hamcrest dependency to 2.2")
-                    return '\n'.join(lines)
-        
-        # For "add" strategy or if no existing hamcrest found, add new dependency
-        # Find dependencies block
-        in_dependencies = False
+    def _find_gradle_insertion_point(self, lines: List[str], first_line: int = 0) -> Tuple[int, str]:
+        """
+        Find where to add Hamcrest in the first multi-line dependencies block.
+        
+        Scanning starts at first_line. Returns the line index after the last
+        top-level test dependency (or of the closing brace when there is none)
+        and the indent to use, or -1.
+        """
+        start = -1
+        opened = False
         brace_count = 0
         insertion_line = -1
         base_indent = "    "
         
-        for i, line in enumerate(lines):
+        for i in range(first_line, len(lines)):
+            line = lines[i]
             stripped = line.strip()
             
-            if not in_dependencies and stripped.startswith('dependencies'):
-                in_dependencies = True
+            if start == -1:
+                if not self.GRADLE_DEPENDENCIES_START_PATTERN.match(stripped):
+                    continue
+                start = i
+                opened = False
                 brace_count = 0
-                # Extract indentation
-                match = re.match(r'^(\s*)', line)
-                if match:
-                    base_indent = match.group(1) + "    "
-                continue
+                insertion_line = -1
+                base_indent = line[:len(line) - len(line.lstrip())] + "    "
             
-            if in_dependencies:
+            # Most dependency lines carry no braces; skip counting for those
+            if '{' in line or '}' in line:
                 brace_count += line.count('{') - line.count('}')
-                
-                # Look for test dependencies section or any test dependency
-                if ('test' in stripped.lower() and 
-                    ('implementation' in stripped or 'compile' in stripped or 'api' in stripped)):
-                    insertion_line = i + 1
-                
-                # End of dependencies block
-                if brace_count == 0:
-                    if insertion_line == -1:
-                        # No test dependencies found, insert before closing brace
-                        insertion_line = i
-                    break
-        
-        if insertion_line != -1:
-            # Add comment and dependency
-            hamcrest_lines = [
-                f"{base_indent}// AAA-Issue-Refactor: Hamcrest dependency",
-                f"{base_indent}{self.HAMCREST_GRADLE}"
-            ]
+                opened = opened or brace_count > 0
             
-            for line_to_insert in reversed(hamcrest_lines):
-                lines.insert(insertion_line, line_to_insert)
+            if not opened and i > start:
+                # "dependencies" was not followed by a block
+                start = -1
+                continue
+            
+            # Look for test dependencies at the top level of the block
+            lowered = stripped.lower()
+            if (i > start and brace_count == 1 and 'test' in lowered and
+                ('implementation' in lowered or 'compile' in lowered or 'api' in lowered)):
+                insertion_line = i + 1
             
-            return '\n'.join(lines)
+            # End of dependencies block
+            if opened and brace_count <= 0:
+                if i == start:
+                    # One-line block, nothing to insert into; keep looking
+                    start = -1
+                    continue
+                if insertion_line == -1:
+                    # No test dependencies found, insert before closing brace
+                    insertion_line = i
+                return insertion_line, base_indent
         
+        return -1, base_indent
+    
+    def _read_cached_build_file(self, file_path: Path) -> str:
+        """Read a build file during detection and keep its content for the add step."""
+        content = self._read_build_file(file_path)
+        self._content_cache[file_path] = content
         return content
     
+    def _take_build_file(self, file_path: Path) -> str:
+        """
+        Get build file content for modification, reusing the detection read.
+        
+        Cached content is consumed so a later add call reads the file again.
+        """
+        content = self._content_cache.pop(file_path, None)
+        if content is None:
+            content = self._read_build_file(file_path)
+        return content
+    
+    @staticmethod
+    def _read_build_file(file_path: Path) -> str:
+        """
+        Read a build file as UTF-8 without failing on legacy encodings.
+        
+        Undecodable bytes are kept as surrogate escapes so that writing the
+        content back with _write_build_file reproduces them unchanged.
+        """
+        return file_path.read_bytes().decode('utf-8', errors='surrogateescape')
+    
+    @staticmethod
+    def _write_build_file(file_path: Path, content: str):
+        """
+        Write build file content read by _read_build_file.
+        
+        The content goes to a temporary sibling first and is renamed over the
+        original, so an interrupted run never leaves a half-written build file.
+        """
+        tmp_path = file_path.with_suffix(file_path.suffix + '.aif_tmp')
+        try:
+            tmp_path.write_bytes(content.encode('utf-8', errors='surrogateescape'))
+            shutil.copymode(file_path, tmp_path)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    
     def _backup_file(self, file_path: Path):
         """Backup a file before modification."""
         backup_path = file_path.with_suffix(file_path.suffix + '.aif_backup')
-        backup_path.write_text(file_path.read_text(encoding='utf-8'), encoding='utf-8')
-        self.backup_files.append(backup_path)
-        logger.debug(f"Backed up {file_path} to {backup_path}")
+        # Hardlink the original: _write_build_file replaces the file with a new inode,
+        # so the link keeps the untouched bytes without copying them
+        try:
+            os.link(file_path, backup_path)
+        except OSError:
+            # Stale backup, cross-device or no hardlink support
+            shutil.copyfile(file_path, backup_path)
+        with self._backup_lock:
+            self.backup_files.append((file_path, backup_path))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Backed up {file_path} to {backup_path}")
     
     def restore_backups(self):
         """Restore all backed up files."""
         restored = []
-        for backup_path in self.backup_files:
+        for original_path, backup_path in self.backup_files:
             try:
-                original_path = backup_path.with_suffix('')
-                original_path = original_path.with_suffix(original_path.suffix.replace('.aif_backup', ''))
-                
-                original_path.write_text(backup_path.read_text(encoding='utf-8'), encoding='utf-8')
-                backup_path.unlink()  # Remove backup file
+                os.replace(backup_path, original_path)  # Moves the backup back in place
                 restored.append(original_path.name)
                 
             except Exception as e:
@@ -650,10 +843,9 @@ class DependencyManager:
     
     def cleanup(self):
         """Clean up any remaining backup files."""
-        for backup_path in self.backup_files:
+        for _, backup_path in self.backup_files:
             try:
-                if backup_path.exists():
-                    backup_path.unlink()
+                backup_path.unlink(missing_ok=True)
             except Exception as e:
                 logger.debug(f"Failed to cleanup backup {backup_path}: {e}")
         
@@ -19,6 +19,14 @@ class ResultsRecorder:
         'dsl': 'v2_dsl', 
         'testsmell': 'v3_testsmell'
     }
+
+    # Per strategy: (strategy, prefix, code, error, imports, method names, result) column names
+    STRATEGY_COLUMNS = [
+        (strategy, prefix, f'{prefix}_refactored_test_case_code', f'{prefix}_refactoring_error',
+         f'{prefix}_refactored_test_case_imports', f'{prefix}_refactored_method_names',
+         f'{prefix}_refactored_test_case_result')
+        for strategy, prefix in STRATEGY_MAPPING.items()
+    ]
     
     def __init__(self, output_path: Path):
         self.output_path = output_path
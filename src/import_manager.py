@@ -131,8 +131,21 @@ class SmartImportManager:
         r'\bOptional\.': 'java.util.Optional',
     }
     
+    # Union of all the patterns above: code matching none of them needs no imports
+    REQUIREMENT_TRIGGER_PATTERN = re.compile('|'.join(
+        f'(?:{pattern})'
+        for patterns in (JUNIT5_STATIC_IMPORTS, JUNIT4_STATIC_IMPORTS, JUNIT5_ASSUMPTIONS, JUNIT4_ASSUMPTIONS,
+                         HAMCREST_MATCHERS, HAMCREST_CORE_MATCHERS, JAVA_UTIL_IMPORTS)
+        for pattern in patterns
+    ))
+    
+    # Package declaration of a Java source file
+    PACKAGE_DECLARATION_PATTERN = re.compile(r'package\s+([\w\.]+);')
+    
     def __init__(self, project_path: Path):
         self.project_path = project_path
+        # Last (content, package) pair: callers normalize many imports against the same file
+        self._package_cache: Tuple[Optional[str], Optional[str]] = (None, None)
         self.dependency_info = self._get_dependency_info()
         self.junit_version = self._detect_junit_version()
         self.hamcrest_version = self._detect_hamcrest_version()
@@ -316,6 +329,10 @@ class SmartImportManager:
         Returns:
             List of import requirements that are not already satisfied
         """
+        # Cheap single-pass check before the per-pattern analysis below
+        if not code or not self.REQUIREMENT_TRIGGER_PATTERN.search(code):
+            return []
+        
         requirements = []
         existing_imports = existing_imports or set()
         
@@ -910,6 +927,17 @@ class SmartImportManager:
         
         return cleaned
     
+    def _extract_package(self, content: str) -> Optional[str]:
+        """Extract the package declared in Java source content, reusing the last result for the same content."""
+        cached_content, cached_package = self._package_cache
+        if content is cached_content:
+            return cached_package
+        
+        package_match = self.PACKAGE_DECLARATION_PATTERN.search(content)
+        package = package_match.group(1) if package_match else None
+        self._package_cache = (content, package)
+        return package
+    
     def _is_import_satisfied(self, required_import: str, existing_imports: Set[str]) -> bool:
         """
         Check if a required import is already satisfied by existing imports.
@@ -1121,9 +1149,7 @@ class SmartImportManager:
         }
         
         # Extract test package from file content
-        package_match = re.search(r'package\s+([\w\.]+);', test_file_content)
-        if package_match:
-            analysis['test_package'] = package_match.group(1)
+        analysis['test_package'] = self._extract_package(test_file_content)
         
         # Common testing frameworks and utilities (should not be flagged)
         testing_patterns = [
@@ -1,10 +1,60 @@
 """Logging configuration for the application."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
 
+# Background listener that writes queued records to the debug log file
+_queue_listener = None
+
+
+def _stop_queue_listener():
+    """Flush pending records and stop the background listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+# Per-thread tag prepended to log lines, e.g. the strategy a worker thread runs
+_log_context = threading.local()
+
+
+class _LogPrefixFilter(logging.Filter):
+    """Prepend the emitting thread's log prefix, keeping leading blank lines first."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        prefix = getattr(_log_context, 'prefix', None)
+        if prefix:
+            message = record.getMessage()
+            body = message.lstrip('\n')
+            record.msg = f"{message[:len(message) - len(body)]}[{prefix}] {body}"
+            record.args = None
+        return True
+
+
+_log_prefix_filter = _LogPrefixFilter()
+
+
+@contextmanager
+def log_prefix(prefix: str):
+    """Tag every 'aif' log line emitted by the current thread with prefix."""
+    previous = getattr(_log_context, 'prefix', None)
+    _log_context.prefix = prefix
+    try:
+        yield
+    finally:
+        _log_context.prefix = previous
+
+
 def setup_logger(output_path: Path, debug_mode: bool = False):
     """
     Configure the logger for the application.
@@ -13,14 +63,19 @@ def setup_logger(output_path: Path, debug_mode: bool = False):
         output_path: The directory where logs will be stored.
         debug_mode: If True, sets logging level to DEBUG and enables file logging.
     """
+    global _queue_listener
     logger = logging.getLogger('aif')
+    _stop_queue_listener()
     logger.handlers.clear()  # Prevent duplicate handlers across runs
+    # Runs in the emitting thread, before records reach the (possibly queued) handlers
+    logger.addFilter(_log_prefix_filter)
     
     # Set level based on debug mode
     log_level = logging.DEBUG if debug_mode else logging.INFO
     logger.setLevel(log_level)
     
-    # Console Handler - always on, shows INFO or DEBUG
+    # Console Handler - always on, shows INFO or DEBUG. It stays synchronous so
+    # log lines are on screen before any interactive print()/input() prompt.
     console_handler = logging.StreamHandler(sys.stdout)
     # Use a simple formatter for console to keep output clean
     console_formatter = logging.Formatter('%(message)s')
@@ -38,8 +93,13 @@ def setup_logger(output_path: Path, debug_mode: bool = False):
         file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(module)s - %(message)s')
         file_handler.setFormatter(file_formatter)
         file_handler.setLevel(logging.DEBUG)
-        logger.addHandler(file_handler)
-        
+
+        # Debug file I/O happens on a background thread so logging never blocks the caller
+        log_queue = queue.SimpleQueue()
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _queue_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        _queue_listener.start()
+
         # Announce the log file creation via the logger itself
         logger.info(f"✓ Debug mode enabled. Detailed logs will be saved to: {log_file}")
         
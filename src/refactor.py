@@ -7,6 +7,7 @@ import pandas as pd
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
 import yaml
 
@@ -18,6 +19,19 @@ from .import_manager import SmartImportManager
 
 logger = logging.getLogger('aif')
 
+
+@lru_cache(maxsize=256)
+def _read_test_context_json(json_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Read a test context JSON file once and share it across strategies and retries.
+    
+    mtime_ns is part of the cache key so a regenerated file is read again. The bound
+    covers the window in which concurrent strategies reach the same test case.
+    """
+    with open(json_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
 @dataclass
 class TestContext:
     """Container for test case context information."""
@@ -444,24 +458,27 @@ class TestRefactor:
         json_filename = f"{project_name}_{test_class}_{test_method}.json"
         json_path = self.data_folder_path / json_filename
         
-        if not json_path.exists():
+        try:
+            mtime_ns = json_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(f"Test context JSON not found: {json_path}")
         
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _read_test_context_json(json_path, mtime_ns)
         
+        # Build a fresh TestContext each time, with its own lists: callers overwrite its
+        # fields during refinement and the parsed JSON is shared through the cache
         return TestContext(
-            parsed_statements_sequence=data.get("parsedStatementsSequence", []),
-            production_function_implementations=data.get("productionFunctionImplementations", []),
+            parsed_statements_sequence=list(data.get("parsedStatementsSequence", [])),
+            production_function_implementations=list(data.get("productionFunctionImplementations", [])),
             test_case_source_code=data.get("testCaseSourceCode", ""),
-            imported_packages=data.get("importedPackages", []),
+            imported_packages=list(data.get("importedPackages", [])),
             test_class_name=data.get("testClassName", ""),
             test_case_name=data.get("testCaseName", ""),
             project_name=data.get("projectName", ""),
-            before_methods=data.get("beforeMethods", []),
-            before_all_methods=data.get("beforeAllMethods", []),
-            after_methods=data.get("afterMethods", []),
-            after_all_methods=data.get("afterAllMethods", [])
+            before_methods=list(data.get("beforeMethods", [])),
+            before_all_methods=list(data.get("beforeAllMethods", [])),
+            after_methods=list(data.get("afterMethods", [])),
+            after_all_methods=list(data.get("afterAllMethods", []))
         )
     
     def parse_refactoring_response(self, response: str) -> Dict[str, Any]:
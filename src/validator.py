@@ -3,7 +3,7 @@
 import re
 import subprocess
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Optional, Tuple, List, Dict
 import logging
 
 from .build_system import create_build_system, BuildSystem
@@ -53,9 +53,67 @@ class CodeValidator:
             - str: The updated content of the file.
             - List[int]: A list of line numbers where code was inserted.
         """
-        original_content = ""  # Initialize to avoid UnboundLocalError
         try:
             original_content = test_file_path.read_text(encoding='utf-8')
+        except Exception as e:
+            logger.error(f"Error integrating refactored method: {e}", exc_info=True)
+            return False, "", []
+
+        return self._integrate_into_content(
+            original_content, test_file_path, original_method_name, refactored_code,
+            strategy, additional_imports, is_one_to_many, debug_mode
+        )
+
+    def integrate_refactored_methods(
+        self,
+        test_file_path: Path,
+        integrations: List[Tuple[str, str, bool]],
+        strategy: str,
+        debug_mode: bool = False,
+        content: Optional[str] = None
+    ) -> Tuple[str, List[bool]]:
+        """
+        Integrates several refactored methods into the same test file in one pass.
+
+        The file is read once and each refactoring is applied to the accumulated content,
+        so callers can write and compile the file a single time.
+
+        Args:
+            test_file_path: Path to the Java test file.
+            integrations: (original_method_name, refactored_code, is_one_to_many) per refactoring.
+            strategy: The refactoring strategy used (e.g., 'aaa', 'dsl').
+            debug_mode: True if debug mode is enabled.
+            content: Current content of the file, if already read; read from disk otherwise.
+
+        Returns:
+            A tuple containing:
+            - str: The updated content of the file.
+            - List[bool]: Success flag for each entry of `integrations`, in order.
+        """
+        if content is None:
+            content = test_file_path.read_text(encoding='utf-8')
+        results = []
+        for original_method_name, refactored_code, is_one_to_many in integrations:
+            success, content, _ = self._integrate_into_content(
+                content, test_file_path, original_method_name, refactored_code,
+                strategy, None, is_one_to_many, debug_mode
+            )
+            results.append(success)
+        return content, results
+
+    def _integrate_into_content(
+        self,
+        original_content: str,
+        test_file_path: Path,
+        original_method_name: str,
+        refactored_code: str,
+        strategy: str,
+        additional_imports: Optional[List[str]] = None,
+        is_one_to_many: bool = False,
+        debug_mode: bool = False
+    ) -> Tuple[bool, str, List[int]]:
+        """Integrates refactored code into the given file content (see integrate_refactored_method)."""
+        try:
             modified_content = original_content
             
             # Step 1: Add new imports if any
@@ -283,6 +341,34 @@ class CodeValidator:
             logger.debug(f"Could not find method declaration for '{method_name}'")
             return -1, -1
 
+        return self._method_span_from_line(lines, method_name, method_line_idx)
+
+    def _find_method_spans(self, lines: List[str], method_names: List[str]) -> Dict[str, Tuple[int, int]]:
+        """Finds the spans of several methods (see _find_method_span) with a single scan of the lines.
+
+        Methods that cannot be found map to (-1, -1).
+        """
+        spans = {name: (-1, -1) for name in method_names}
+        if not spans:
+            return spans
+
+        pattern = re.compile(r'\b(' + '|'.join(re.escape(name) for name in spans) + r')\s*\(')
+        remaining = set(spans)
+        for i, line in enumerate(lines):
+            for match in pattern.finditer(line):
+                name = match.group(1)
+                if name in remaining:
+                    remaining.discard(name)
+                    spans[name] = self._method_span_from_line(lines, name, i)
+            if not remaining:
+                break
+
+        for name in remaining:
+            logger.debug(f"Could not find method declaration for '{name}'")
+        return spans
+
+    def _method_span_from_line(self, lines: List[str], method_name: str, method_line_idx: int) -> Tuple[int, int]:
+        """Expands the line declaring a method to its full span: preceding annotations through closing brace."""
         # Find the start of the method's annotations by looking backwards
         start_line = method_line_idx
         for i in range(method_line_idx - 1, -1, -1):
@@ -379,6 +465,18 @@ class CodeValidator:
         
         return self.build_system.run_specific_test(test_class, test_method, test_file_path)
     
+    def run_specific_tests(
+        self,
+        test_class: str,
+        test_methods: List[str],
+        test_file_path: Optional[Path] = None,
+        max_workers: int = 1
+    ) -> Dict[str, Tuple[bool, str]]:
+        """Run several methods of a test class, batched when the build system supports it."""
+        logger.debug(f"Running tests using {self.build_system.get_build_system_name()}: "
+                     f"{test_class}.{{{', '.join(test_methods)}}}")
+        return self.build_system.run_specific_tests(test_class, test_methods, test_file_path, max_workers)
+    
     def get_build_system_name(self) -> str:
         """Get the name of the build system being used."""
         return self.build_system.get_build_system_name()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Unit tests for cli module."""
+
+import unittest
+import tempfile
+from pathlib import Path
+
+from src.cli import _extract_method_names_from_code, _discover_test_file_path, load_test_cases_from_csv
+
+
+class TestExtractMethodNames(unittest.TestCase):
+    """Test the _extract_method_names_from_code helper."""
+
+    def test_extract_method_names(self):
+        """Test extracting method names from Java code."""
+        code = '''public class OptionTest {
+    @Test
+    public void testSubclass() throws Exception {
+    }
+
+    private static List<String> buildNames(int count) {
+        return null;
+    }
+
+    public OptionTest() {
+    }
+}'''
+        result = _extract_method_names_from_code(code)
+        self.assertEqual(result, ["testSubclass", "buildNames"])
+
+    def test_extract_method_names_empty(self):
+        """Test extracting method names from empty code."""
+        self.assertEqual(_extract_method_names_from_code(""), [])
+
+
+class TestDiscoverTestFilePath(unittest.TestCase):
+    """Test the _discover_test_file_path helper."""
+
+    def setUp(self):
+        """Set up a project with two test source layouts."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.temp_dir) / "java_project"
+        self.search_base = self.project_path / "data"
+        self.search_base.mkdir(parents=True)
+
+        maven_dir = self.project_path / "src" / "test" / "java" / "org" / "example"
+        maven_dir.mkdir(parents=True)
+        (maven_dir / "FooTest.java").write_text("public class FooTest { }")
+
+        legacy_dir = self.project_path / "test" / "org" / "example"
+        legacy_dir.mkdir(parents=True)
+        (legacy_dir / "BarTest.java").write_text("public class BarTest { }")
+
+    def test_discover_test_file_path(self):
+        """Test discovering files across different test directories."""
+        foo = _discover_test_file_path("org.example.FooTest", self.search_base)
+        bar = _discover_test_file_path("org.example.BarTest", self.search_base)
+
+        self.assertEqual(Path(foo), self.project_path / "src/test/java/org/example/FooTest.java")
+        self.assertEqual(Path(bar), self.project_path / "test/org/example/BarTest.java")
+
+    def test_discover_test_file_path_not_found(self):
+        """Test discovering a class that does not exist."""
+        self.assertIsNone(_discover_test_file_path("org.example.MissingTest", self.search_base))
+        self.assertIsNone(_discover_test_file_path("", self.search_base))
+
+
+
+class TestLoadTestCasesFromCsv(unittest.TestCase):
+    """Test loading test cases from a discovery CSV."""
+
+    def test_load_test_cases_tolerates_loc_formats_and_short_rows(self):
+        """Test that float-formatted LOC values are kept and short rows get empty fields."""
+        temp_dir = Path(tempfile.mkdtemp())
+        csv_file = temp_dir / "data" / "cases.csv"
+        csv_file.parent.mkdir()
+        csv_file.write_text(
+            "project_name,test_class_name,test_method_name,issue_type,test_path,test_case_LOC,runable,pass\n"
+            "proj,p.FooTest,testA,Multiple AAA,/x/FooTest.java,12.0,yes,yes\n"
+            "proj,p.FooTest,testB,Good AAA,/x/FooTest.java, 7 ,no,no\n"
+            "proj,p.FooTest,testC,Obscure Assert,/x/FooTest.java\n"
+        )
+
+        test_cases = load_test_cases_from_csv(csv_file)
+
+        self.assertEqual([tc.test_case_loc for tc in test_cases], [12, 7, 0])
+        self.assertEqual(test_cases[2].runable, '')
+        self.assertEqual(test_cases[2].pass_status, '')
+
+
+if __name__ == '__main__':
+    unittest.main()
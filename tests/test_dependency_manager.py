@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Unit tests for dependency_manager module."""
+
+import unittest
+import tempfile
+from pathlib import Path
+
+from src.dependency_manager import DependencyManager
+
+
+POM_TEMPLATE = '''<project>
+    <artifactId>{name}</artifactId>
+    <dependencies>
+        <dependency>
+            <groupId>junit</groupId>
+            <artifactId>junit</artifactId>
+            <version>4.13.2</version>
+            <scope>test</scope>
+        </dependency>
+    </dependencies>
+</project>
+'''
+
+
+class TestDependencyManagerMaven(unittest.TestCase):
+    """Test Hamcrest handling for Maven projects."""
+
+    def setUp(self):
+        """Set up a multi-module Maven project."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.temp_dir) / "java_project"
+        self.project_path.mkdir()
+
+        self.poms = [self.project_path / "pom.xml"]
+        (self.project_path / "pom.xml").write_text(POM_TEMPLATE.format(name="parent"))
+        for name in ["core", "plugins", "extras"]:
+            module_dir = self.project_path / name
+            module_dir.mkdir()
+            (module_dir / "pom.xml").write_text(POM_TEMPLATE.format(name=name))
+            self.poms.append(module_dir / "pom.xml")
+
+        self.manager = DependencyManager(self.project_path)
+
+    def test_detect_build_system(self):
+        """Test detecting a Maven project."""
+        self.assertEqual(self.manager.build_system, "maven")
+
+    def test_add_hamcrest_all_modules(self):
+        """Test adding Hamcrest to every module pom."""
+        success, message = self.manager.add_hamcrest_dependency()
+
+        self.assertTrue(success)
+        self.assertIn("Added to 4 modules", message)
+        for pom in self.poms:
+            content = pom.read_text()
+            self.assertIn(DependencyManager.MAVEN_START_MARKER, content)
+            self.assertLess(content.index(DependencyManager.MAVEN_END_MARKER), content.index("</dependencies>"))
+        self.assertEqual(len(self.manager.backup_files), 4)
+        self.assertEqual(self.manager._content_cache, {})
+
+    def test_add_hamcrest_skips_backup_for_unmodified_pom(self):
+        """Test that poms which already have Hamcrest are not backed up."""
+        core_pom = self.project_path / "core" / "pom.xml"
+        core_pom.write_text(core_pom.read_text().replace(
+            "<artifactId>junit</artifactId>\n            <version>4.13.2</version>",
+            "<artifactId>hamcrest</artifactId>\n            <version>2.2</version>"))
+
+        success, message = self.manager._add_hamcrest_maven_all_modules()
+
+        self.assertTrue(success)
+        self.assertIn("Already present in 1 modules", message)
+        self.assertEqual(len(self.manager.backup_files), 3)
+        self.assertFalse((self.project_path / "core" / "pom.xml.aif_backup").exists())
+
+    def test_scan_skips_pruned_directories(self):
+        """Test that build files under tool directories are not collected."""
+        vendored = self.project_path / "node_modules" / "pkg"
+        vendored.mkdir(parents=True)
+        (vendored / "pom.xml").write_text(POM_TEMPLATE.format(name="vendored"))
+
+        self.assertEqual(sorted(self.manager._scan_project()["maven"]), sorted(self.poms))
+
+    def test_detection_reused_until_pom_changes(self):
+        """Test that Hamcrest detection is shared across instances until a pom changes."""
+        core_pom = self.project_path / "core" / "pom.xml"
+        info = self.manager._detect_existing_hamcrest_dependency()
+        self.assertFalse(info["exists"])
+
+        other = DependencyManager(self.project_path)
+        self.assertEqual(other._detect_existing_hamcrest_dependency(), info)
+
+        core_pom.write_text(core_pom.read_text().replace(
+            "<groupId>junit</groupId>\n            <artifactId>junit</artifactId>",
+            "<groupId>org.hamcrest</groupId>\n            <artifactId>hamcrest-all</artifactId>"))
+        info = DependencyManager(self.project_path)._detect_existing_hamcrest_dependency()
+        self.assertTrue(info["exists"])
+        self.assertEqual(info["format"], "hamcrest-all")
+
+    def test_add_hamcrest_keeps_non_utf8_bytes(self):
+        """Test that a Latin-1 encoded pom is modified without mangling other bytes."""
+        pom = self.project_path / "pom.xml"
+        pom.write_bytes(POM_TEMPLATE.format(name="caf\xe9").encode('latin-1'))
+
+        self.manager._add_hamcrest_maven_all_modules()
+
+        content = pom.read_bytes()
+        self.assertIn(b"<artifactId>caf\xe9</artifactId>", content)
+        self.assertIn(DependencyManager.MAVEN_START_MARKER.encode('utf-8'), content)
+
+    def test_restore_backups(self):
+        """Test restoring pom files after adding Hamcrest."""
+        originals = {pom: pom.read_text() for pom in self.poms}
+
+        self.manager.add_hamcrest_dependency()
+        self.manager.restore_backups()
+
+        for pom, original in originals.items():
+            self.assertEqual(pom.read_text(), original)
+        self.assertEqual(self.manager.backup_files, [])
+
+
+class TestDependencyManagerGradle(unittest.TestCase):
+    """Test Hamcrest insertion into Gradle build files."""
+
+    def setUp(self):
+        """Set up a Gradle project."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.project_path = Path(self.temp_dir) / "java_project"
+        self.project_path.mkdir()
+        (self.project_path / "build.gradle").write_text("dependencies {\n}\n")
+        self.manager = DependencyManager(self.project_path)
+
+    def test_detect_build_system(self):
+        """Test detecting a Gradle project."""
+        self.assertEqual(self.manager.build_system, "gradle")
+
+    def test_add_after_last_test_dependency(self):
+        """Test inserting after the last top-level test dependency."""
+        content = """buildscript {
+    repositories { mavenCentral() }
+}
+dependencies {
+    implementation 'a:b:1'
+    testImplementation 'junit:junit:4.13'
+    testImplementation('x:y:1') {
+        exclude group: 'z'
+    }
+}"""
+        lines = self.manager._add_to_gradle_dependencies(content).split('\n')
+
+        self.assertEqual(lines[5], "    testImplementation 'junit:junit:4.13'")
+        self.assertEqual(lines[6], "    // AAA-Issue-Refactor: Hamcrest dependency")
+        self.assertEqual(lines[7], "    " + DependencyManager.HAMCREST_GRADLE)
+
+    def test_add_to_empty_dependencies_block(self):
+        """Test inserting into an empty block closes it correctly."""
+        result = self.manager._add_to_gradle_dependencies("dependencies {\n}")
+
+        self.assertEqual(result, "dependencies {\n    // AAA-Issue-Refactor: Hamcrest dependency\n"
+                                 f"    {DependencyManager.HAMCREST_GRADLE}\n}}")
+
+    def test_restore_backups_keeps_full_file_names(self):
+        """Test restoring Kotlin DSL build files with multi-part suffixes."""
+        kts_file = self.project_path / "lib" / "build.gradle.kts"
+        kts_file.parent.mkdir()
+        kts_file.write_text("dependencies {\n}\n")
+
+        self.manager._add_hamcrest_gradle_all_modules()
+        self.manager.restore_backups()
+
+        self.assertEqual(kts_file.read_text(), "dependencies {\n}\n")
+        self.assertEqual(list(self.project_path.glob("**/*.aif_backup")), [])
+
+    def test_upgrade_existing_hamcrest(self):
+        """Test upgrading an old Hamcrest declaration."""
+        content = "dependencies {\n    testCompile 'org.hamcrest:hamcrest-all:1.3'\n}"
+        result = self.manager._add_to_gradle_dependencies(content, "upgrade")
+
+        self.assertIn("// testCompile 'org.hamcrest:hamcrest-all:1.3'", result)
+        self.assertIn('testImplementation "org.hamcrest:hamcrest:2.2"', result)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,7 @@
 import unittest
 import tempfile
 import json
+import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -147,6 +148,24 @@ class TestTestRefactor(unittest.TestCase):
         self.assertEqual(context.test_class_name, "TestClass")
         self.assertEqual(context.project_name, "test-project")
     
+    @patch('src.refactor.LLMClient')
+    def test_load_test_context_rereads_regenerated_file(self, mock_llm_client):
+        """Test that cached contexts follow file changes and do not share lists."""
+        json_file = self.data_folder / "test-project_TestClass_testMethod.json"
+        json_file.write_text(json.dumps({"testCaseSourceCode": "old code", "importedPackages": ["import1"]}))
+        
+        refactor = TestRefactor(self.prompts_dir, self.data_folder, "aaa")
+        context = refactor.load_test_context("test-project", "TestClass", "testMethod")
+        context.imported_packages.append("import2")
+        self.assertEqual(refactor.load_test_context("test-project", "TestClass", "testMethod").imported_packages,
+                         ["import1"])
+        
+        json_file.write_text(json.dumps({"testCaseSourceCode": "new code"}))
+        os.utime(json_file, ns=(0, json_file.stat().st_mtime_ns + 1_000_000))
+        context = refactor.load_test_context("test-project", "TestClass", "testMethod")
+        
+        self.assertEqual(context.test_case_source_code, "new code")
+    
     @patch('src.refactor.LLMClient')
     def test_load_test_context_not_found(self, mock_llm_client):
         """Test loading test context when file doesn't exist."""